@@ -26,7 +26,8 @@ Warning:
 """
 
 from typing import (
-    Dict
+    Dict,
+    Optional
 )
 
 
@@ -37,70 +38,87 @@ from fapy.finite_automaton import (
     FiniteAutomaton
 )
 from fapy.regular_expression import (
-    parse_regular_expression,
     RegularExpression
 )
 
 
-def _concat(left: str, right: str) -> str:
+def _concat(
+        left: Optional[RegularExpression],
+        right: Optional[RegularExpression]) -> Optional[RegularExpression]:
     """Convenience function
 
-    Takes two string representations of regular expressions, where the empty
-    string is considered as matching the empty langage, and returns a string
-    representation of their concatenation.
+    Takes two optional regular expressions, where ``None`` is considered as
+    matching the empty langage, and returns their concatenation.
     """
-    if len(left) > 0 and len(right) > 0:
-        return left + right
-    return ''
+    if left is None or right is None:
+        return None
+    if left.node_type == 'EPSILON':
+        return right
+    if right.node_type == 'EPSILON':
+        return left
+    return RegularExpression('CONCAT', left=left, right=right)
 
 
-def _plus(left: str, right: str) -> str:
+def _plus(
+        left: Optional[RegularExpression],
+        right: Optional[RegularExpression]) -> Optional[RegularExpression]:
     """Convenience function
 
-    Takes two string representations of regular expressions, where the empty
-    string is considered as matching the empty langage, and returns a string
-    representation of their sum.
+    Takes two optional regular expressions, where ``None`` is considered as
+    matching the empty langage, and returns their sum.
     """
-    if len(left) > 0 and len(right) > 0:
-        return left + '+' + right
-    if len(left) > 0:
+    if left is not None and right is not None:
+        return RegularExpression('PLUS', left=left, right=right)
+    if left is not None:
         return left
     return right
 
 
-def _star(inner: str) -> str:
+def _star(
+        inner: Optional[RegularExpression]) -> RegularExpression:
     """Convenience function
 
-    Takes a string representations of a regular expression, where the empty
-    string is considered as matching the empty langage, and returns its star
-    regular expression.
+    Takes an optional regular expression, where ``None`` is considered as
+    matching the empty langage, and returns its star regular expression.
     """
-    if len(inner) > 0:
-        return f'({inner})*'
-    return 'ε'
+    if inner is not None:
+        return RegularExpression('STAR', inner=inner)
+    return RegularExpression('EPSILON')
 
 
 def brozozwski(automaton: FiniteAutomaton) -> RegularExpression:
     """Implementation of Brozozwski's algorithm for regular expressions
+
+    The elimination table holds :class:`RegularExpression` nodes (``None``
+    standing for the empty langage) that are combined and shared directly,
+    instead of string representations that would be reparsed at the end.
+    The ε-simplifications of the :class:`RegularExpression` constructor keep
+    the intermediate expressions small.
+
+    Raises:
+        ValueError: If the automaton recognizes the empty langage
     """
 
     q_init = 'init'
     q_acc = 'acc'
-    table: Dict[State, Dict[State, str]] = {
+    epsilon = RegularExpression('EPSILON')
+    table: Dict[State, Dict[State, Optional[RegularExpression]]] = {
         q_acc: {},
         q_init: {}
     }
     for state in automaton.initial_states:
-        table[q_init][state] = 'ε'
+        table[q_init][state] = epsilon
     for state in automaton.states:
         table[state] = {}
         for letter, next_state in automaton.transitions.get(state, []):
-            if next_state in table[state]:
-                table[state][next_state] += '+' + letter
-            else:
-                table[state][next_state] = letter
+            arrow = epsilon if letter == 'ε' else \
+                RegularExpression('LETTER', letter=letter)
+            table[state][next_state] = _plus(
+                table[state].get(next_state),
+                arrow
+            )
     for state in automaton.accepting_states:
-        table[state][q_acc] = 'ε'
+        table[state][q_acc] = epsilon
 
     states_to_remove = list(automaton.states)
     states_to_remove.sort()
@@ -112,10 +130,10 @@ def brozozwski(automaton: FiniteAutomaton) -> RegularExpression:
             for q_l in states_to_remove + [q_init, q_acc]:
                 if q_l == q_i:
                     continue
-                e_kl = table[q_k].get(q_l, '')
-                e_ki = table[q_k].get(q_i, '')
-                e_ii = table[q_i].get(q_i, '')
-                e_il = table[q_i].get(q_l, '')
+                e_kl = table[q_k].get(q_l)
+                e_ki = table[q_k].get(q_i)
+                e_ii = table[q_i].get(q_i)
+                e_il = table[q_i].get(q_l)
                 table[q_k][q_l] = _plus(
                     e_kl,
                     _concat(
@@ -127,4 +145,7 @@ def brozozwski(automaton: FiniteAutomaton) -> RegularExpression:
                     )
                 )
 
-    return parse_regular_expression(table[q_init].get(q_acc, ''))
+    result = table[q_init].get(q_acc)
+    if result is None:
+        raise ValueError('The automaton recognizes the empty langage')
+    return result
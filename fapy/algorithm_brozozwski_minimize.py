@@ -24,11 +24,16 @@ from fapy.algorithm_powerset_determinize import (
 
 def brozozwski_minimize(automaton: FiniteAutomaton) -> FiniteAutomaton:
     """Implements Brozozwski's minimization algoithm
+
+    Two reverse-determinize passes suffice: if :math:`\\mathcal{A}` is any
+    finite automaton (nondeterministic and with
+    :math:`\\epsilon`-transitions allowed), then :math:`\\mathrm{det}
+    (\\mathcal{A}^t)` recognizes the mirror langage of :math:`\\mathcal{A}`
+    and only has accessible states, so determinizing its transpose in turn
+    yields the minimal deterministic automaton.
     """
     return powerset_determinize(transpose(
-        powerset_determinize(transpose(
-            powerset_determinize(automaton)
-        ))
+        powerset_determinize(transpose(automaton))
     ))
 
 
@@ -45,8 +50,8 @@ def transpose(automaton: FiniteAutomaton) -> FiniteAutomaton:
     transposed_transitions: Dict[State, List[Tuple[Letter, State]]] = {}
     for state in automaton.states:
         transposed_transitions[state] = []
-    for state_left in automaton.transitions:
-        for letter, state_right in automaton.transitions[state_left]:
+    for (state_left, letter), states_right in automaton.transition_map.items():
+        for state_right in states_right:
             transposed_transitions[state_right].append((letter, state_left))
 
     return FiniteAutomaton(
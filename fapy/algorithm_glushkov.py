@@ -4,11 +4,20 @@ See also:
     `Wikipedia page <https://en.wikipedia.org/wiki/Glushkov%27s_construction_algorithm>`_
 """
 
+from functools import (
+    lru_cache
+)
 from typing import (
+    Dict,
+    List,
+    Set,
     Tuple
 )
 
 
+from fapy.common import (
+    Letter
+)
 from fapy.finite_automaton import (
     FiniteAutomaton
 )
@@ -51,83 +60,159 @@ def _linearize_regular_expression(
         1. The linearized regular expression
         2. The next available index
 
+    The AST is traversed iteratively in post-order with an explicit stack, so
+    that linearizing deep regular expressions does not pay Python call
+    overhead per node nor hit the recursion limit.
+
+    Raises:
+        NotImplementedError: If :attr:`RegularExpression.node_type` is
+            invalid
+    """
+
+    results = []  # type: List[RegularExpression]
+    stack = [(regular_expression, False)]
+    while stack:
+        node, visited = stack.pop()
+        if visited:
+            if node.node_type in ['CONCAT', 'PLUS']:
+                right = results.pop()
+                left = results.pop()
+                results.append(
+                    RegularExpression(node.node_type, left=left, right=right)
+                )
+            else:  # STAR
+                results.append(
+                    RegularExpression('STAR', inner=results.pop())
+                )
+        elif node.node_type in ['CONCAT', 'PLUS']:
+            stack.append((node, True))
+            stack.append((node.right, False))
+            stack.append((node.left, False))
+        elif node.node_type == 'EPSILON':
+            results.append(RegularExpression('EPSILON'))
+        elif node.node_type == 'LETTER':
+            results.append(
+                RegularExpression(
+                    'LETTER',
+                    letter=str(node.letter) + str(index)
+                )
+            )
+            index += 1
+        elif node.node_type == 'STAR':
+            stack.append((node, True))
+            stack.append((node.inner, False))
+        else:
+            raise NotImplementedError(f'Unknown node type {node.node_type}')
+
+    return (results[0], index)
+
+
+def _position_functions(
+        regular_expression: RegularExpression
+) -> Tuple[Set[Letter], Set[Letter], Dict[Letter, Set[Letter]], bool]:
+    """Computes the Glushkov position functions in a single bottom-up pass
+
+    Returns a tuple formed by
+
+    1. the set of initial letters (*First*),
+    2. the set of accepting letters (*Last*),
+    3. the successor table (*Follow*), mapping each letter to the set of
+       letters that may follow it,
+    4. whether the expression accepts the empty word (*Null*).
+
+    On a linearized regular expression (see
+    :meth:`_linearize_regular_expression`), this computes in one traversal
+    what repeated calls to :meth:`RegularExpression.initial_letters`,
+    :meth:`RegularExpression.accepting_letters`,
+    :meth:`RegularExpression.successors` (once per letter of the alphabet),
+    and :meth:`RegularExpression.accepts_epsilon` would recompute over the
+    whole AST each time.
+
     Raises:
         NotImplementedError: If :attr:`RegularExpression.node_type` is
             invalid
     """
 
     if regular_expression.node_type == 'CONCAT':
-        left, index = _linearize_regular_expression(
-            regular_expression.left,
-            index
+        first_l, last_l, follow, null_l = _position_functions(
+            regular_expression.left
         )
-        right, index = _linearize_regular_expression(
-            regular_expression.right,
-            index
+        first_r, last_r, follow_r, null_r = _position_functions(
+            regular_expression.right
         )
-        return (RegularExpression('CONCAT', left=left, right=right), index)
+        for letter in follow_r:
+            follow[letter] = follow.get(letter, set()) | follow_r[letter]
+        for letter in last_l:
+            follow[letter] = follow.get(letter, set()) | first_r
+        first = first_l | first_r if null_l else first_l
+        last = last_l | last_r if null_r else last_r
+        return (first, last, follow, null_l and null_r)
 
     if regular_expression.node_type == 'EPSILON':
-        return (RegularExpression('EPSILON'), index)
+        return (set(), set(), {}, True)
 
     if regular_expression.node_type == 'LETTER':
-        return (
-            RegularExpression(
-                'LETTER',
-                letter=str(regular_expression.letter) + str(index)
-            ),
-            index + 1
-        )
+        letter = regular_expression.letter
+        return ({letter}, {letter}, {}, False)
 
     if regular_expression.node_type == 'PLUS':
-        left, index = _linearize_regular_expression(
-            regular_expression.left,
-            index
+        first_l, last_l, follow, null_l = _position_functions(
+            regular_expression.left
         )
-        right, index = _linearize_regular_expression(
-            regular_expression.right,
-            index
+        first_r, last_r, follow_r, null_r = _position_functions(
+            regular_expression.right
         )
-        return (RegularExpression('PLUS', left=left, right=right), index)
+        for letter in follow_r:
+            follow[letter] = follow.get(letter, set()) | follow_r[letter]
+        return (first_l | first_r, last_l | last_r, follow, null_l or null_r)
 
     if regular_expression.node_type == 'STAR':
-        inner, index = _linearize_regular_expression(
-            regular_expression.inner,
-            index
-        )
-        return (RegularExpression('STAR', inner=inner), index)
+        first, last, follow, _ = _position_functions(regular_expression.inner)
+        for letter in last:
+            follow[letter] = follow.get(letter, set()) | first
+        return (first, last, follow, True)
 
-    raise NotImplementedError(f'Unknown node type {regular_expression.node_type}')
+    raise NotImplementedError(
+        f'Unknown node type {regular_expression.node_type}'
+    )
 
 
+@lru_cache(maxsize=128)
 def glushkov(regular_expression: RegularExpression) -> FiniteAutomaton:
     """Implementation of Glushkov's algorithm
+
+    Results are cached (by the regular expression itself, which hashes and
+    compares structurally), so that constructing the automaton of the same
+    expression twice only incurs the quadratic construction cost once; the
+    cache is bounded like the parse cache. Consequently, the returned
+    :class:`finite_automaton.FiniteAutomaton` must not be mutated.
     """
 
     linearized, _ = _linearize_regular_expression(regular_expression)
+    first, last, follow, null = _position_functions(linearized)
     q_init_result = '0'
     result = FiniteAutomaton(
         alphabet=regular_expression.alphabet(),
         states=linearized.alphabet() | {q_init_result},
         initial_states={q_init_result},
-        accepting_states=linearized.accepting_letters(),
+        accepting_states=last,
         transitions={
             q_init_result: []
         }
     )
 
-    for letter in linearized.initial_letters():
+    for letter in first:
         real_letter = letter[0]
         result.transitions[q_init_result].append((real_letter, letter))
 
     for letter in linearized.alphabet():
         if letter not in result.transitions:
             result.transitions[letter] = []
-        for successor in linearized.successors(letter):
+        for successor in follow.get(letter, set()):
             real_letter = successor[0]
             result.transitions[letter].append((real_letter, successor))
 
-    if linearized.accepts_epsilon():
+    if null:
         result.accepting_states |= {q_init_result}
 
     return result
@@ -9,6 +9,10 @@ states, and :math:`a \\in A` a letter, :math:`\\gamma (S, a)` is the
 :math:`\\epsilon`-closure of all states reachable from :math:`S` by reading
 :math:`a`.
 
+Internally, subsets of states are represented as integer bitmasks (bit
+:math:`i` is set if and only if state :math:`i` belongs to the subset), so
+that subset union is a single ``|``, and subsets hash as plain integers.
+
 See also:
     `Wikipedia page <https://en.wikipedia.org/wiki/Powerset_construction>`_
 """
@@ -18,6 +22,7 @@ from copy import (
 )
 from typing import (
     Dict,
+    Iterator,
     List,
     Set,
     Tuple,
@@ -32,6 +37,22 @@ from fapy.finite_automaton import (
 )
 
 
+def _bits(mask: int) -> Iterator[int]:
+    """Convenience function that iterates over the indices of the bits set in
+    a bitmask
+
+    Example::
+
+        list(_bits(0b1101))
+
+    returns ``[0, 2, 3]``.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 def _state_identifier(state_set: Set[State]) -> str:
     """Convenience function that provides a name for a set of states
 
@@ -50,46 +71,86 @@ def powerset_determinize(automaton: FiniteAutomaton) -> FiniteAutomaton:
     """Implementation of the powerset determinization method
     """
 
-    initial_state = automaton.epsilon_closure(automaton.initial_states)
-    initial_state_identifier = _state_identifier(initial_state)
-    state_dict: Dict[str, Set[State]] = {
-        initial_state_identifier: initial_state
+    state_list = sorted(automaton.states)
+    state_index = {state: i for i, state in enumerate(state_list)}
+
+    # Per-state successor bitmasks, split by letter
+    epsilon_successors: List[int] = [0] * len(state_list)
+    move: Dict[Letter, List[int]] = {}
+    for state in automaton.transitions:
+        index = state_index[state]
+        for letter, next_state in automaton.transitions[state]:
+            next_mask = 1 << state_index[next_state]
+            if letter == 'ε':
+                epsilon_successors[index] |= next_mask
+            else:
+                if letter not in move:
+                    move[letter] = [0] * len(state_list)
+                move[letter][index] |= next_mask
+
+    # Per-state ε-closure bitmasks, so that closing a subset is a union of
+    # precomputed masks instead of a fixed-point iteration per subset
+    closure_masks: List[int] = [0] * len(state_list)
+    for index in range(len(state_list)):
+        mask = 1 << index
+        frontier = mask
+        while frontier:
+            new = 0
+            for bit in _bits(frontier):
+                new |= epsilon_successors[bit]
+            frontier = new & ~mask
+            mask |= new
+        closure_masks[index] = mask
+
+    def _epsilon_closure(mask: int) -> int:
+        closed = 0
+        for index in _bits(mask):
+            closed |= closure_masks[index]
+        return closed
+
+    def _identifier(mask: int) -> str:
+        return _state_identifier({state_list[i] for i in _bits(mask)})
+
+    accepting_mask = 0
+    for state in automaton.accepting_states:
+        accepting_mask |= 1 << state_index[state]
+
+    initial_mask = 0
+    for state in automaton.initial_states:
+        initial_mask |= 1 << state_index[state]
+    initial_mask = _epsilon_closure(initial_mask)
+    initial_state_identifier = _identifier(initial_mask)
+
+    mask_identifiers: Dict[int, str] = {
+        initial_mask: initial_state_identifier
     }
-
-    unexplored_state_identifiers: List[str] = [initial_state_identifier]
-
+    unexplored_masks: List[int] = [initial_mask]
     transitions: Dict[State, List[Tuple[Letter, State]]] = {}
+    accepting_states: Set[State] = set()
 
-    while unexplored_state_identifiers:
-        state_identifier = unexplored_state_identifiers.pop(0)
+    while unexplored_masks:
+        mask = unexplored_masks.pop(0)
+        state_identifier = mask_identifiers[mask]
         transitions[state_identifier] = []
-        arrows: Dict[Letter, Set[State]] = {}
-        for state in state_dict[state_identifier]:
-            for letter, next_state in automaton.transitions.get(state, []):
-                if letter == 'ε':
-                    continue
-                if letter not in arrows:
-                    arrows[letter] = set()
-                arrows[letter].add(next_state)
-        for letter in arrows:
-            arrows[letter] = automaton.epsilon_closure(arrows[letter])
-            next_state_identifier = _state_identifier(arrows[letter])
-            if next_state_identifier not in state_dict:
-                state_dict[next_state_identifier] = arrows[letter]
-                unexplored_state_identifiers.append(next_state_identifier)
+        if mask & accepting_mask:
+            accepting_states.add(state_identifier)
+        for letter, successors in move.items():
+            next_mask = 0
+            for index in _bits(mask):
+                next_mask |= successors[index]
+            if not next_mask:
+                continue
+            next_mask = _epsilon_closure(next_mask)
+            if next_mask not in mask_identifiers:
+                mask_identifiers[next_mask] = _identifier(next_mask)
+                unexplored_masks.append(next_mask)
             transitions[state_identifier].append(
-                (letter, next_state_identifier)
+                (letter, mask_identifiers[next_mask])
             )
 
-    states = set(state_dict.keys())
-    accepting_states: Set[State] = set()
-    for state_identifier in state_dict:
-        if automaton.accepting_states.intersection(state_dict[state_identifier]):
-            accepting_states.add(state_identifier)
-
     return FiniteAutomaton(
         alphabet=deepcopy(automaton.alphabet),
-        states=states,
+        states=set(mask_identifiers.values()),
         initial_states={initial_state_identifier},
         accepting_states=accepting_states,
         transitions=transitions
@@ -10,6 +10,9 @@ The main function of this module, :meth:`algorithm_residual.residual`, takes a
 and returns a :class:`regular_expression.RegularExpression`.
 """
 
+from functools import (
+    lru_cache
+)
 from typing import (
     Dict,
     List,
@@ -114,6 +117,11 @@ def _residual_star(
     return None
 
 
+_MAX_STATES = 1000
+"""Maximum number of states :meth:`residual_automaton` may explore before
+giving up, see there"""
+
+
 def _state_identifier(regular_expression: Optional[RegularExpression]) -> str:
     """Convenience function that provides a string representation of an
     ``Optional[regular_expression.RegularExpression]``
@@ -123,6 +131,41 @@ def _state_identifier(regular_expression: Optional[RegularExpression]) -> str:
     return str(regular_expression).replace(' ', '')
 
 
+@lru_cache(maxsize=1024)
+def _residual_letter_memoized(
+        regular_expression: RegularExpression,
+        letter: Letter) -> Optional[RegularExpression]:
+    """Single letter residual computation, memoized by the regular expression
+
+    Since regular expressions hash and compare structurally (see
+    :meth:`regular_expression.RegularExpression.__hash__`), residuating a
+    given subexpression by the same letter twice, e.g. while exploring the
+    recursive ``CONCAT``/``STAR`` cases, only walks the AST once — whether
+    or not the two queries use the same node object. The memo is bounded,
+    like the parse cache and the read step memo.
+
+    Raises:
+        NotImplementedError: If :attr:`RegularExpression.node_type` is
+            invalid
+    """
+    result: Optional[RegularExpression]
+    if regular_expression.node_type == 'CONCAT':
+        result = _residual_concat(regular_expression, letter)
+    elif regular_expression.node_type == 'EPSILON':
+        result = None
+    elif regular_expression.node_type == 'LETTER':
+        result = _residual_letter(regular_expression, letter)
+    elif regular_expression.node_type == 'PLUS':
+        result = _residual_plus(regular_expression, letter)
+    elif regular_expression.node_type == 'STAR':
+        result = _residual_star(regular_expression, letter)
+    else:
+        raise NotImplementedError(
+            f'Unknown node type {regular_expression.node_type}'
+        )
+    return result
+
+
 def residual(
         regular_expression: Optional[RegularExpression],
         word: str) -> Optional[RegularExpression]:
@@ -134,34 +177,30 @@ def residual(
             invalid
     """
 
-    if regular_expression is None:
-        return None
-    if not word:
-        return regular_expression
-    if len(word) > 1:
-        return residual(residual(regular_expression, word[0]), word[1:])
-
-    letter = word[0]
-
-    if regular_expression.node_type == 'CONCAT':
-        return _residual_concat(regular_expression, letter)
-    if regular_expression.node_type == 'EPSILON':
-        return None
-    if regular_expression.node_type == 'LETTER':
-        return _residual_letter(regular_expression, letter)
-    if regular_expression.node_type == 'PLUS':
-        return _residual_plus(regular_expression, letter)
-    if regular_expression.node_type == 'STAR':
-        return _residual_star(regular_expression, letter)
-    raise NotImplementedError(
-        f'Unknown node type {regular_expression.node_type}'
-    )
+    for letter in word:
+        if regular_expression is None:
+            return None
+        regular_expression = _residual_letter_memoized(
+            regular_expression,
+            letter
+        )
+    return regular_expression
 
 
 def residual_automaton(
         regular_expression: RegularExpression) -> FiniteAutomaton:
     """From a regular expression, constructs an equivalent finite automaton
     using the residuals method
+
+    Since residuals are not canonicalized, syntactically distinct but
+    equivalent residuals are explored as distinct states, and on some
+    expressions (e.g. :math:`(b^* + \\epsilon)(b^* + a)`) the exploration
+    produces ever-growing residuals and never terminates. The exploration is
+    therefore capped at :data:`_MAX_STATES` states.
+
+    Raises:
+        ValueError: If the construction explores more than
+            :data:`_MAX_STATES` states
     """
 
     initial_state = _state_identifier(regular_expression)
@@ -183,6 +222,12 @@ def residual_automaton(
                 transitions[state].append((letter, next_state))
                 # Equivalent re can have different string representations...
                 if next_state not in transitions:
+                    if len(transitions) >= _MAX_STATES:
+                        raise ValueError(
+                            'The residual construction explored more than '
+                            f'{_MAX_STATES} states; the residuals of the '
+                            'regular expression do not seem to converge'
+                        )
                     transitions[next_state] = []
                     unexplored_states.append(next_state)
 
@@ -21,15 +21,63 @@ from fapy.regular_expression import (
 )
 
 
+def _collapse_epsilon_chains(automaton: FiniteAutomaton) -> FiniteAutomaton:
+    """Removes :math:`\\epsilon`-only pass-through states from an automaton
+
+    A state is a *pass-through* if it is neither initial nor accepting, has
+    exactly one incoming transition and one outgoing transition, and at
+    least one of the two is an :math:`\\epsilon`-transition. Every word
+    going through such a state takes both transitions in sequence, so the
+    state can be removed and its predecessor connected directly to its
+    successor, labelled by the non-:math:`\\epsilon` transition (or
+    :math:`\\epsilon` if both are). Such states are an artifact of
+    Thompson's construction, whose composition steps wire sub-automata
+    together with fresh :math:`\\epsilon`-transitions. The automaton is
+    modified in place and returned.
+    """
+    while True:
+        predecessors = {}  # type: dict
+        for state in automaton.transitions:
+            for letter, next_state in automaton.transitions[state]:
+                predecessors.setdefault(next_state, []).append(
+                    (state, letter)
+                )
+        collapsed = False
+        for state in list(automaton.states):
+            if state in automaton.initial_states:
+                continue
+            if state in automaton.accepting_states:
+                continue
+            incoming = predecessors.get(state, [])
+            outgoing = automaton.transitions.get(state, [])
+            if len(incoming) != 1 or len(outgoing) != 1:
+                continue
+            (previous_state, letter_in) = incoming[0]
+            (letter_out, next_state) = outgoing[0]
+            if letter_in != 'ε' and letter_out != 'ε':
+                continue
+            if previous_state == state or next_state == state:
+                continue
+            letter = letter_out if letter_in == 'ε' else letter_in
+            automaton.states.remove(state)
+            del automaton.transitions[state]
+            arrows = automaton.transitions[previous_state]
+            arrows[arrows.index((letter_in, state))] = (letter, next_state)
+            collapsed = True
+            break
+        if not collapsed:
+            return automaton
+
+
 def _thompson_concat(
         regular_expression: RegularExpression,
         alphabet: Alphabet,
         index: int = 0) -> FiniteAutomaton:
     """Thompson's algorithm, ``CONCAT`` case
     """
-    left = thompson(regular_expression.left, alphabet, index)
+    left = _thompson(regular_expression.left, alphabet, index)
     index += len(left.states)
-    right = thompson(regular_expression.right, alphabet, index)
+    right = _thompson(regular_expression.right, alphabet, index)
     return left * right
 
 
@@ -57,9 +105,9 @@ def _thompson_plus(
         index: int = 0) -> FiniteAutomaton:
     """Thompson's algorithm, ``PLUS`` case
     """
-    left = thompson(regular_expression.left, alphabet, index)
+    left = _thompson(regular_expression.left, alphabet, index)
     index += len(left.states)
-    right = thompson(regular_expression.right, alphabet, index)
+    right = _thompson(regular_expression.right, alphabet, index)
     index += len(right.states)
     return empty_word_automaton(f'q{index}') * (left + right) * \
         empty_word_automaton(f'q{index + 1}')
@@ -71,7 +119,7 @@ def _thompson_star(
         index: int = 0) -> FiniteAutomaton:
     """Thompson's algorithm, ``STAR`` case
     """
-    inner = thompson(regular_expression.inner, alphabet, index)
+    inner = _thompson(regular_expression.inner, alphabet, index)
     index += len(inner.states)
     q_init_inner = list(inner.initial_states)[0]
     q_acc_inner = list(inner.accepting_states)[0]
@@ -84,11 +132,11 @@ def _thompson_star(
     return result
 
 
-def thompson(
+def _thompson(
         regular_expression: RegularExpression,
         alphabet: Alphabet,
         index: int = 0) -> FiniteAutomaton:
-    """Implementation of Thompson's algorithm
+    """Recursive part of Thompson's algorithm
 
     Raises:
         NotImplementedError: If :attr:`RegularExpression.node_type` is
@@ -107,3 +155,25 @@ def thompson(
     raise NotImplementedError(
         f'Unknown node type {regular_expression.node_type}'
     )
+
+
+def thompson(
+        regular_expression: RegularExpression,
+        alphabet: Alphabet,
+        index: int = 0) -> FiniteAutomaton:
+    """Implementation of Thompson's algorithm
+
+    The automaton produced by the textbook construction (see
+    :meth:`_thompson`) is post-processed with
+    :meth:`_collapse_epsilon_chains` to remove the pass-through states left
+    behind by the composition steps. The collapse only runs on the final
+    automaton: running it on intermediate results would invalidate the
+    state-numbering scheme the construction relies on for unique names.
+
+    Raises:
+        NotImplementedError: If :attr:`RegularExpression.node_type` is
+            invalid
+    """
+    return _collapse_epsilon_chains(
+        _thompson(regular_expression, alphabet, index)
+    )
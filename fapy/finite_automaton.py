@@ -33,12 +33,15 @@ whose langage consists in all words containing the letter :math:`a`.
   :meth:`FiniteAutomaton.is_deterministic`.
 """
 
-from copy import (
-    deepcopy
+from sys import (
+    intern
 )
 from typing import (
+    AbstractSet,
     Dict,
+    FrozenSet,
     List,
+    Optional,
     Set,
     Tuple,
     Union
@@ -49,13 +52,17 @@ from graphviz import (
 )
 
 from fapy.common import (
-    Alphabet,
     Letter,
     State,
     Word
 )
 
 
+_STEP_CACHE_SIZE = 4096
+"""Maximum number of memoized subset-automaton transitions per automaton,
+see :meth:`FiniteAutomaton.read`"""
+
+
 class FiniteAutomaton:
     """Finite automaton
     """
@@ -124,15 +131,17 @@ class FiniteAutomaton:
     # pylint: disable=too-many-arguments
     def __init__(
             self,
-            alphabet: Alphabet,
-            states: Set[State],
-            initial_states: Set[State],
-            accepting_states: Set[State],
+            alphabet: AbstractSet[Letter],
+            states: AbstractSet[State],
+            initial_states: AbstractSet[State],
+            accepting_states: AbstractSet[State],
             transitions: Dict[State, List[Tuple[Letter, State]]]):
         """Constructor
 
         Args:
-            alphabet: The alphabet of the automaton
+            alphabet: The alphabet of the automaton; any set-like collection
+                (e.g. a :class:`frozenset`) is accepted, as the constructor
+                copies it
             states: The set of states
             initial_states: The subset of initial states
             accepting_states: The subset of accepting states
@@ -146,18 +155,20 @@ class FiniteAutomaton:
 
         """
 
-        self.alphabet = alphabet
-        self.states = states
-        self.initial_states = initial_states
-        self.accepting_states = accepting_states
-        self.transitions = transitions
+        self._transition_map = \
+            None  # type: Optional[Dict[Tuple[State, Letter], FrozenSet[State]]]
+        self._epsilon_closures = \
+            None  # type: Optional[Dict[State, FrozenSet[State]]]
+        self._read_tables = \
+            None  # type: Optional[Tuple[Dict[Letter, List[int]], int, int]]
+        self._step_cache = {}  # type: Dict[Tuple[int, Letter], int]
 
         # Parameters validation
         if not initial_states:
             raise ValueError('An automaton must have at least 1 initial state')
-        if not initial_states.issubset(states):
+        if not initial_states <= states:
             raise ValueError('initial_states ⊈ states')
-        if not accepting_states.issubset(states):
+        if not accepting_states <= states:
             raise ValueError('accepting_states ⊈ states')
         for state in transitions:
             if state not in states:
@@ -175,6 +186,103 @@ class FiniteAutomaton:
                         f'unknown state "{next_state}"'
                     )
 
+        # State and letter interning: states and letters are hashed and
+        # compared in every set and dict operation of every algorithm, and
+        # interned strings hash once and compare by pointer on the fast path
+        self.alphabet = {intern(letter) for letter in alphabet}
+        self.states = {intern(state) for state in states}
+        self.initial_states = {intern(state) for state in initial_states}
+        self.accepting_states = {intern(state) for state in accepting_states}
+        if transitions:
+            self.transitions = {
+                intern(state): [
+                    (intern(letter), intern(next_state))
+                    for letter, next_state in arrows
+                ]
+                for state, arrows in transitions.items()
+            }
+        else:
+            self.transitions = transitions
+
+    def _compile_transition_map(
+            self) -> Dict[Tuple[State, Letter], FrozenSet[State]]:
+        """Flattens :attr:`FiniteAutomaton.transitions` into a map from
+        ``(state, letter)`` pairs to frozen sets of successor states
+
+        The map is computed on first use and reused afterwards, so that
+        :meth:`FiniteAutomaton.read` does not have to rescan the transition
+        lists for every letter of every word. The successor sets are frozen
+        so that no consumer can mutate the compiled form behind the back of
+        another. Consequently, :attr:`FiniteAutomaton.transitions` must not
+        be modified once the automaton has read a word.
+        """
+        if self._transition_map is None:
+            successors: Dict[Tuple[State, Letter], Set[State]] = {}
+            for state in self.transitions:
+                for letter, next_state in self.transitions[state]:
+                    successors.setdefault((state, letter), set()).add(
+                        next_state
+                    )
+            self._transition_map = {
+                key: frozenset(value) for key, value in successors.items()
+            }
+        return self._transition_map
+
+    def _compile_read_tables(self) -> Tuple[Dict[Letter, List[int]], int, int]:
+        """Compiles the bitmask tables used by :meth:`FiniteAutomaton.read`
+
+        States are assigned dense indices, and sets of states are represented
+        as integer bitmasks (bit :math:`i` set if and only if state :math:`i`
+        belongs to the set). Returns a tuple formed by
+
+        1. a map from each letter to a per-state list of successor bitmasks,
+           with :math:`\\epsilon`-closures folded in,
+        2. the bitmask of the :math:`\\epsilon`-closed set of initial states,
+        3. the bitmask of the set of accepting states.
+
+        The tables are computed on first use and reused afterwards.
+        Consequently, :attr:`FiniteAutomaton.transitions` must not be
+        modified once the automaton has read a word.
+        """
+        if self._read_tables is None:
+            state_list = sorted(self.states)
+            state_index = {state: i for i, state in enumerate(state_list)}
+            closures = self._compile_epsilon_closures()
+            closure_masks = []
+            for state in state_list:
+                mask = 0
+                for next_state in closures[state]:
+                    mask |= 1 << state_index[next_state]
+                closure_masks.append(mask)
+            letter_masks: Dict[Letter, List[int]] = {}
+            for (state, letter), next_states in \
+                self._compile_transition_map().items():
+                if letter == 'ε':
+                    continue
+                if letter not in letter_masks:
+                    letter_masks[letter] = [0] * len(state_list)
+                for next_state in next_states:
+                    letter_masks[letter][state_index[state]] |= \
+                        closure_masks[state_index[next_state]]
+            initial_mask = 0
+            for state in self.initial_states:
+                initial_mask |= closure_masks[state_index[state]]
+            accepting_mask = 0
+            for state in self.accepting_states:
+                accepting_mask |= 1 << state_index[state]
+            self._read_tables = (letter_masks, initial_mask, accepting_mask)
+        return self._read_tables
+
+    @property
+    def transition_map(self) -> Dict[Tuple[State, Letter], FrozenSet[State]]:
+        """The transition function, flattened into a map from ``(state,
+        letter)`` pairs to frozen sets of successor states
+
+        Compiled on first access, see
+        :meth:`FiniteAutomaton._compile_transition_map`.
+        """
+        return self._compile_transition_map()
+
     def draw(self, **kwargs) -> Digraph:
         """Renders the automaton using graphviz
 
@@ -203,6 +311,32 @@ class FiniteAutomaton:
                 graph.edge(str(state), str(next_state), label=label)
         return graph
 
+    def _compile_epsilon_closures(self) -> Dict[State, FrozenSet[State]]:
+        """Computes the :math:`\\epsilon`-closure of every individual state
+
+        The closures are computed on first use and reused afterwards, so that
+        :meth:`FiniteAutomaton.epsilon_closure` reduces to a union of
+        precomputed sets instead of a graph traversal per call. Consequently,
+        :attr:`FiniteAutomaton.transitions` must not be modified once a
+        closure has been computed.
+        """
+        if self._epsilon_closures is None:
+            transition_map = self._compile_transition_map()
+            closures: Dict[State, FrozenSet[State]] = {}
+            for state in self.states:
+                states_closed = {state}
+                unexplored_states = [state]
+                while unexplored_states:
+                    unexplored_state = unexplored_states.pop()
+                    for next_state in \
+                        transition_map.get((unexplored_state, 'ε'), set()):
+                        if next_state not in states_closed:
+                            states_closed.add(next_state)
+                            unexplored_states.append(next_state)
+                closures[state] = frozenset(states_closed)
+            self._epsilon_closures = closures
+        return self._epsilon_closures
+
     def epsilon_closure(self, states: Set[State]) -> Set[State]:
         """Computes the :math:`\\epsilon`-closure of a set of states
 
@@ -210,16 +344,15 @@ class FiniteAutomaton:
         :math:`\\epsilon`-*closure* if the set of states reachable from any
         state of :math:`S` using :math:`0` or more
         :math:`\\epsilon`-transitions.
+
+        The per-state closures are precomputed (see
+        :meth:`FiniteAutomaton._compile_epsilon_closures`), so this is a
+        plain union.
         """
-        states_closed = deepcopy(states)
-        unexplored_states = list(states)
-        while unexplored_states:
-            unexplored_state = unexplored_states.pop(0)
-            for letter, next_state in \
-                self.transitions.get(unexplored_state, []):
-                if letter == 'ε' and next_state not in states_closed:
-                    states_closed.add(next_state)
-                    unexplored_states.append(next_state)
+        closures = self._compile_epsilon_closures()
+        states_closed: Set[State] = set()
+        for state in states:
+            states_closed |= closures[state]
         return states_closed
 
     def is_deterministic(self) -> bool:
@@ -235,27 +368,95 @@ class FiniteAutomaton:
         if len(self.initial_states) != 1:
             return False
         for state in self.transitions:
-            letters = [letter for letter, _ in self.transitions[state]]
-            if len(letters) != len(set(letters)):
-                return False
-            if 'ε' in letters:
-                return False
+            seen_letters: Set[Letter] = set()
+            for letter, _ in self.transitions[state]:
+                if letter == 'ε' or letter in seen_letters:
+                    return False
+                seen_letters.add(letter)
         return True
 
     def read(self, word: Union[str, Word]) -> bool:
         """Reads a word and returns whether the automaton accepts it or not
+
+        The simulation runs on the bitmask tables of
+        :meth:`FiniteAutomaton._compile_read_tables`: the set of active
+        states is a single integer, and reading a letter is a bitwise or of
+        the (:math:`\\epsilon`-closed) successor masks of the active states.
+
+        Each computed step ``(active states, letter) -> new active states``
+        is memoized, so that reading many words over the same automaton
+        lazily determinizes it: once a transition of the underlying subset
+        automaton has been taken, taking it again is a single dictionary
+        lookup. The memo is bounded by :data:`_STEP_CACHE_SIZE` to keep the
+        worst case (exponentially many reachable subsets) in check.
+
+        Words containing letters outside the alphabet are rejected up front
+        by a single bulk membership check, instead of being simulated until
+        the foreign letter empties the active set.
         """
-        if isinstance(word, str):
-            word = list(word)
-        current_states = self.epsilon_closure(self.initial_states)
+        if not self.alphabet.issuperset(word):
+            return False
+        letter_masks, current_mask, accepting_mask = \
+            self._compile_read_tables()
+        step_cache = self._step_cache
         for letter in word:
-            new_states = set()
-            for state in current_states:
-                for arrow_letter, next_state in self.transitions.get(state, []):
-                    if letter == arrow_letter:
-                        new_states.add(next_state)
-            current_states = self.epsilon_closure(new_states)
-        return bool(self.accepting_states.intersection(current_states))
+            new_mask = step_cache.get((current_mask, letter))
+            if new_mask is None:
+                masks = letter_masks.get(letter)
+                if masks is None:
+                    return False
+                new_mask = 0
+                remaining = current_mask
+                while remaining:
+                    lowest_bit = remaining & -remaining
+                    new_mask |= masks[lowest_bit.bit_length() - 1]
+                    remaining ^= lowest_bit
+                if len(step_cache) < _STEP_CACHE_SIZE:
+                    step_cache[(current_mask, letter)] = new_mask
+            current_mask = new_mask
+            if not current_mask:
+                return False
+        return bool(current_mask & accepting_mask)
+
+    def read_batch(self, words: List[Union[str, Word]]) -> List[bool]:
+        """Reads a batch of words and returns, for each of them, whether the
+        automaton accepts it or not
+
+        Words are read in order against a single set of compiled tables, and
+        the step memo of :meth:`FiniteAutomaton.read` is shared across the
+        whole batch, so words with common prefixes (or common active-state
+        sets in general) only pay for each subset transition once.
+        """
+        letter_masks, initial_mask, accepting_mask = \
+            self._compile_read_tables()
+        step_cache = self._step_cache
+        alphabet = self.alphabet
+        results = []
+        for word in words:
+            if not alphabet.issuperset(word):
+                results.append(False)
+                continue
+            current_mask = initial_mask
+            for letter in word:
+                new_mask = step_cache.get((current_mask, letter))
+                if new_mask is None:
+                    masks = letter_masks.get(letter)
+                    if masks is None:
+                        current_mask = 0
+                        break
+                    new_mask = 0
+                    remaining = current_mask
+                    while remaining:
+                        lowest_bit = remaining & -remaining
+                        new_mask |= masks[lowest_bit.bit_length() - 1]
+                        remaining ^= lowest_bit
+                    if len(step_cache) < _STEP_CACHE_SIZE:
+                        step_cache[(current_mask, letter)] = new_mask
+                current_mask = new_mask
+                if not current_mask:
+                    break
+            results.append(bool(current_mask & accepting_mask))
+        return results
 
 
 def empty_word_automaton(state: State = 'q0') -> FiniteAutomaton:
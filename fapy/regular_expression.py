@@ -24,12 +24,20 @@ This regular expression accepts all words containing the letter :math:`a`.
 from copy import (
     deepcopy
 )
+from functools import (
+    lru_cache
+)
 from re import (
     sub
 )
 from typing import (
+    Dict,
+    FrozenSet,
+    List,
     Optional,
-    Set
+    Set,
+    Tuple,
+    Union
 )
 
 
@@ -86,6 +94,18 @@ class RegularExpression:
     """Right node, if applicable"""
     _inner = None  # type: Optional[RegularExpression]
     """Inner node, if applicable"""
+    _accepting_letters = None  # type: Optional[FrozenSet[Letter]]
+    """Cached result of :meth:`RegularExpression.accepting_letters`"""
+    _initial_letters = None  # type: Optional[FrozenSet[Letter]]
+    """Cached result of :meth:`RegularExpression.initial_letters`"""
+    _accepts_epsilon = None  # type: Optional[bool]
+    """Cached result of :meth:`RegularExpression.accepts_epsilon`"""
+    _successors_all = None  # type: Optional[Dict[Letter, FrozenSet[Letter]]]
+    """Cached result of :meth:`RegularExpression.successors_all`"""
+    _alphabet = None  # type: Optional[FrozenSet[Letter]]
+    """Cached result of :meth:`RegularExpression.alphabet`"""
+    _hash = None  # type: Optional[int]
+    """Cached result of :meth:`RegularExpression.__hash__`"""
 
     def __eq__(self, other) -> bool:
         """Compares two regular expressions using their AST
@@ -105,6 +125,28 @@ class RegularExpression:
             return (self.inner == other.inner)
         raise NotImplementedError(f'Unknown node type {self.node_type}')
 
+    def __hash__(self) -> int:
+        """Hashes the regular expression
+
+        The hash is computed from the structure of the AST, so that it is
+        consistent with :meth:`RegularExpression.__eq__` whether or not the
+        subexpressions are interned (the algorithms of this package build
+        non-interned nodes). It is computed once per node and cached, so
+        hashing stays amortized constant time.
+        """
+        if self._hash is None:
+            if self.node_type in ['CONCAT', 'PLUS']:
+                self._hash = hash(
+                    (self.node_type, hash(self._left), hash(self._right))
+                )
+            elif self.node_type == 'LETTER':
+                self._hash = hash((self.node_type, self._letter))
+            elif self.node_type == 'STAR':
+                self._hash = hash((self.node_type, hash(self._inner)))
+            else:
+                self._hash = hash(self.node_type)
+        return self._hash
+
     def __init__(self, node_type: str, **kwargs):
         """Constructor
 
@@ -172,49 +214,80 @@ class RegularExpression:
         For instance the regular expression `(a + ε) b*` is represented as
         `CONCAT(PLUS(a, ε), STAR(b))`.
 
+        The AST is traversed iteratively and the representation assembled with
+        a single :meth:`str.join`, so that building the string is linear in
+        the size of the expression.
+
         Raises:
             NotImplementedError: If :attr:`RegularExpression.node_type` is
                 invalid
         """
-        if self.node_type == 'CONCAT':
-            return 'CONCAT(' + repr(self.left) + ', ' + repr(self.right) + ')'
-        if self.node_type == 'EPSILON':
-            return 'ε'
-        if self.node_type == 'LETTER':
-            return str(self.letter)
-        if self.node_type == 'PLUS':
-            return 'PLUS(' + repr(self.left) + ', ' + repr(self.right) + ')'
-        if self.node_type == 'STAR':
-            return 'STAR(' + repr(self.inner) + ')'
-        raise NotImplementedError(f'Unknown node type {self.node_type}')
+        out = []
+        stack = [self]  # type: List[Union[RegularExpression, str]]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                out.append(node)
+            elif node.node_type == 'CONCAT':
+                stack += [')', node.right, ', ', node.left, 'CONCAT(']
+            elif node.node_type == 'EPSILON':
+                out.append('ε')
+            elif node.node_type == 'LETTER':
+                out.append(str(node.letter))
+            elif node.node_type == 'PLUS':
+                stack += [')', node.right, ', ', node.left, 'PLUS(']
+            elif node.node_type == 'STAR':
+                stack += [')', node.inner, 'STAR(']
+            else:
+                raise NotImplementedError(
+                    f'Unknown node type {node.node_type}'
+                )
+        return ''.join(out)
 
     def __str__(self) -> str:
         """Provides a human-friendly string representation of the regular
         expression
 
+        The AST is traversed iteratively and the representation assembled with
+        a single :meth:`str.join`, so that building the string is linear in
+        the size of the expression.
+
         Raises:
             NotImplementedError: If :attr:`RegularExpression.node_type` is
                 invalid
         """
-        if self.node_type == 'CONCAT':
-            left_str = str(self.left)
-            right_str = str(self.right)
-            if self.left.node_type == 'PLUS':
-                left_str = '(' + left_str +')'
-            if self.right.node_type == 'PLUS':
-                right_str = '(' + right_str +')'
-            return left_str + ' ' + right_str
-        if self.node_type == 'EPSILON':
-            return 'ε'
-        if self.node_type == 'LETTER':
-            return str(self.letter)
-        if self.node_type == 'PLUS':
-            return str(self.left) + ' + ' + str(self.right)
-        if self.node_type == 'STAR':
-            if self.inner.node_type == 'LETTER':
-                return str(self.inner) + '*'
-            return '(' + str(self.inner) + ')*'
-        raise NotImplementedError(f'Unknown node type {self.node_type}')
+        out = []
+        stack = [self]  # type: List[Union[RegularExpression, str]]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                out.append(node)
+            elif node.node_type == 'CONCAT':
+                if node.right.node_type == 'PLUS':
+                    stack += [')', node.right, '(']
+                else:
+                    stack.append(node.right)
+                stack.append(' ')
+                if node.left.node_type == 'PLUS':
+                    stack += [')', node.left, '(']
+                else:
+                    stack.append(node.left)
+            elif node.node_type == 'EPSILON':
+                out.append('ε')
+            elif node.node_type == 'LETTER':
+                out.append(str(node.letter))
+            elif node.node_type == 'PLUS':
+                stack += [node.right, ' + ', node.left]
+            elif node.node_type == 'STAR':
+                if node.inner.node_type == 'LETTER':
+                    stack += ['*', node.inner]
+                else:
+                    stack += [')*', node.inner, '(']
+            else:
+                raise NotImplementedError(
+                    f'Unknown node type {node.node_type}'
+                )
+        return ''.join(out)
 
     def _init_inner(self, **kwargs) -> None:
         """Inits the node with an inner AST
@@ -244,7 +317,7 @@ class RegularExpression:
         self._left = kwargs.get('left')
         self._right = kwargs.get('right')
 
-    def accepting_letters(self) -> Set[Letter]:
+    def accepting_letters(self) -> FrozenSet[Letter]:
         """Returns the accepting letters of the regular expression
 
         A letter is *accepting* if there exist a word accepted by the regular
@@ -252,92 +325,128 @@ class RegularExpression:
         letters of :math:`(a + bc)^*` are :math:`a` and :math:`c`, but not
         :math:`b`.
 
+        The result is an immutable :class:`frozenset`, computed once per node
+        and cached; since parsed subtrees are shared, so are the letter sets.
+
         Raises:
             NotImplementedError: If :attr:`RegularExpression.node_type` is
                 invalid
         """
+        if self._accepting_letters is not None:
+            return self._accepting_letters
         if self.node_type == 'CONCAT':
             if self.right.accepts_epsilon():
-                return self.left.accepting_letters() | \
+                result = self.left.accepting_letters() | \
                     self.right.accepting_letters()
-            return self.right.accepting_letters()
-        if self.node_type == 'EPSILON':
-            return set()
-        if self.node_type == 'LETTER':
-            return {self.letter}
-        if self.node_type == 'PLUS':
-            return self.left.accepting_letters() | \
+            else:
+                result = self.right.accepting_letters()
+        elif self.node_type == 'EPSILON':
+            result = frozenset()
+        elif self.node_type == 'LETTER':
+            result = frozenset({self.letter})
+        elif self.node_type == 'PLUS':
+            result = self.left.accepting_letters() | \
                 self.right.accepting_letters()
-        if self.node_type == 'STAR':
-            return self.inner.accepting_letters()
-        raise NotImplementedError(f'Unknown node type {self.node_type}')
+        elif self.node_type == 'STAR':
+            result = self.inner.accepting_letters()
+        else:
+            raise NotImplementedError(f'Unknown node type {self.node_type}')
+        self._accepting_letters = result
+        return result
 
     def accepts_epsilon(self) -> bool:
         """Returns whether the regular expression accepts the empty word
 
+        The result is a pure function of the AST, computed once per node and
+        cached; since parsed subtrees are shared, so is the cache.
+
         Raises:
             NotImplementedError: If :attr:`RegularExpression.node_type` is
                 invalid
         """
+        if self._accepts_epsilon is not None:
+            return self._accepts_epsilon
         if self.node_type == 'CONCAT':
-            return self.left.accepts_epsilon() and self.right.accepts_epsilon()
-        if self.node_type == 'EPSILON':
-            return True
-        if self.node_type == 'LETTER':
-            return False
-        if self.node_type == 'PLUS':
-            return self.left.accepts_epsilon() or self.right.accepts_epsilon()
-        if self.node_type == 'STAR':
-            return True
-        raise NotImplementedError(f'Unknown node type {self.node_type}')
+            result = \
+                self.left.accepts_epsilon() and self.right.accepts_epsilon()
+        elif self.node_type == 'EPSILON':
+            result = True
+        elif self.node_type == 'LETTER':
+            result = False
+        elif self.node_type == 'PLUS':
+            result = \
+                self.left.accepts_epsilon() or self.right.accepts_epsilon()
+        elif self.node_type == 'STAR':
+            result = True
+        else:
+            raise NotImplementedError(f'Unknown node type {self.node_type}')
+        self._accepts_epsilon = result
+        return result
 
-    def alphabet(self) -> Alphabet:
+    def alphabet(self) -> FrozenSet[Letter]:
         """Returns the alphabet of the regular expression
 
         The alphabet of a regular expression is the set of all letters
         appearing in it. For example, the alphabet of :math:`ac + c^*` is
         :math:`\\{ a, c \\}`.
 
+        The result is an immutable :class:`frozenset`, computed once per node
+        and cached; since parsed subtrees are shared, so are the alphabets.
+
         Raises:
             NotImplementedError: If :attr:`RegularExpression.node_type` is
                 invalid
         """
+        if self._alphabet is not None:
+            return self._alphabet
         if self.node_type in ['CONCAT', 'PLUS']:
-            return self.left.alphabet() | self.right.alphabet()
-        if self.node_type == 'EPSILON':
-            return set()
-        if self.node_type == 'LETTER':
-            return {self.letter}
-        if self.node_type == 'STAR':
-            return self.inner.alphabet()
-        raise NotImplementedError(f'Unknown node type {self.node_type}')
+            result = self.left.alphabet() | self.right.alphabet()
+        elif self.node_type == 'EPSILON':
+            result = frozenset()
+        elif self.node_type == 'LETTER':
+            result = frozenset({self.letter})
+        elif self.node_type == 'STAR':
+            result = self.inner.alphabet()
+        else:
+            raise NotImplementedError(f'Unknown node type {self.node_type}')
+        self._alphabet = result
+        return result
 
-    def initial_letters(self) -> Set[Letter]:
+    def initial_letters(self) -> FrozenSet[Letter]:
         """Returns the initial letters of the regular expression
 
         A letter is *initial* if there exist a word accepted by the regular
         expression starting with that letter. For example, the initial letters
         of :math:`(a + bc)^*` are :math:`a` and :math:`b`, but not :math:`c`.
 
+        The result is an immutable :class:`frozenset`, computed once per node
+        and cached; since parsed subtrees are shared, so are the letter sets.
+
         Raises:
             NotImplementedError: If :attr:`RegularExpression.node_type` is
                 invalid
         """
+        if self._initial_letters is not None:
+            return self._initial_letters
         if self.node_type == 'CONCAT':
             if self.left.accepts_epsilon():
-                return self.left.initial_letters() | \
+                result = self.left.initial_letters() | \
                     self.right.initial_letters()
-            return self.left.initial_letters()
-        if self.node_type == 'EPSILON':
-            return set()
-        if self.node_type == 'LETTER':
-            return {self.letter}
-        if self.node_type == 'PLUS':
-            return self.left.initial_letters() | \
+            else:
+                result = self.left.initial_letters()
+        elif self.node_type == 'EPSILON':
+            result = frozenset()
+        elif self.node_type == 'LETTER':
+            result = frozenset({self.letter})
+        elif self.node_type == 'PLUS':
+            result = self.left.initial_letters() | \
                 self.right.initial_letters()
-        if self.node_type == 'STAR':
-            return self.inner.initial_letters()
-        raise NotImplementedError(f'Unknown node type {self.node_type}')
+        elif self.node_type == 'STAR':
+            result = self.inner.initial_letters()
+        else:
+            raise NotImplementedError(f'Unknown node type {self.node_type}')
+        self._initial_letters = result
+        return result
 
     @property
     def inner(self) -> 'RegularExpression':
@@ -395,33 +504,91 @@ class RegularExpression:
             raise ValueError('Value of member "right" is None')
         return self._right
 
-    def successors(self, letter: Letter) -> Set[Letter]:
+    def successors(self, letter: Letter) -> FrozenSet[Letter]:
         """Returns all potential successors of a given letter
 
         For instance, in :math:`(a + bc)^*`, the successor set of :math:`a` is
         :math:`\\{ b \\}`, the successor set of :math:`b` is :math:`\\{ c \\}`,
         and the successor set of :math:`c` is :math:`\\{ a, b \\}`.
 
+        This is a lookup in the full successor table of
+        :meth:`RegularExpression.successors_all`, so querying every letter of
+        the alphabet costs a single traversal of the AST overall.
+
         Raises:
             NotImplementedError: If :attr:`RegularExpression.node_type` is
                 invalid
         """
-        if self.node_type == 'CONCAT':
-            if letter in self.left.accepting_letters():
-                return self.left.successors(letter) | \
-                    self.right.successors(letter) | \
-                    self.right.initial_letters()
-            return self.left.successors(letter) | self.right.successors(letter)
-        if self.node_type in ['EPSILON', 'LETTER']:
-            return set()
-        if self.node_type == 'PLUS':
-            return self.left.successors(letter) | self.right.successors(letter)
-        if self.node_type == 'STAR':
-            if letter in self.inner.accepting_letters():
-                return self.inner.successors(letter) | \
-                    self.inner.initial_letters()
-            return self.inner.successors(letter)
-        raise NotImplementedError(f'Unknown node type {self.node_type}')
+        return self.successors_all().get(letter, frozenset())
+
+    def successors_all(self) -> Dict[Letter, FrozenSet[Letter]]:
+        """Returns the successor sets of all letters of the regular
+        expression at once
+
+        The result maps each letter to the set that
+        :meth:`RegularExpression.successors` would return for it; letters
+        without successors may be absent from the map. It is computed in a
+        single bottom-up traversal of the AST, cached on the node, and
+        immutable; since parsed subtrees are shared, so are the tables.
+
+        Raises:
+            NotImplementedError: If :attr:`RegularExpression.node_type` is
+                invalid
+        """
+        if self._successors_all is not None:
+            return self._successors_all
+        followers = {}  # type: Dict[Letter, Set[Letter]]
+        if self.node_type in ['CONCAT', 'PLUS']:
+            for letter, successors in self.left.successors_all().items():
+                followers[letter] = set(successors)
+            for letter, successors in self.right.successors_all().items():
+                followers.setdefault(letter, set()).update(successors)
+            if self.node_type == 'CONCAT':
+                initial_letters = self.right.initial_letters()
+                for letter in self.left.accepting_letters():
+                    followers.setdefault(letter, set()).update(
+                        initial_letters
+                    )
+        elif self.node_type in ['EPSILON', 'LETTER']:
+            pass
+        elif self.node_type == 'STAR':
+            for letter, successors in self.inner.successors_all().items():
+                followers[letter] = set(successors)
+            initial_letters = self.inner.initial_letters()
+            for letter in self.inner.accepting_letters():
+                followers.setdefault(letter, set()).update(initial_letters)
+        else:
+            raise NotImplementedError(f'Unknown node type {self.node_type}')
+        result = {
+            letter: frozenset(successors)
+            for letter, successors in followers.items()
+        }
+        self._successors_all = result
+        return result
+
+
+_INTERN_TABLE: Dict[Tuple, RegularExpression] = {}
+"""Intern table mapping node keys to canonical
+:class:`RegularExpression` instances, see :meth:`_intern`"""
+
+
+def _intern(node: RegularExpression) -> RegularExpression:
+    """Interns a regular expression node
+
+    If a node with the same type and the same (identity-wise) subexpressions
+    has already been interned, returns it, so that structurally equal subtrees
+    built by the parser share a single object. Otherwise, registers ``node``
+    as the canonical instance and returns it. This is safe because parse
+    results are immutable.
+    """
+    key = (
+        node.node_type,
+        id(node._left),  # pylint: disable=protected-access
+        id(node._right),  # pylint: disable=protected-access
+        node._letter,  # pylint: disable=protected-access
+        id(node._inner)  # pylint: disable=protected-access
+    )
+    return _INTERN_TABLE.setdefault(key, node)
 
 
 class ReLexer(Lexer):
@@ -462,11 +629,11 @@ class ReParser(Parser):
 
     @attach('e : EPSILON')
     def epsilon(self, epsilon):
-        return RegularExpression('EPSILON')
+        return _intern(RegularExpression('EPSILON'))
 
     @attach('e : LETTER')
     def letter(self, letter):
-        return RegularExpression('LETTER', letter=letter)
+        return _intern(RegularExpression('LETTER', letter=letter))
 
     @attach('e : LPAREN e RPAREN')
     def parens(self, lparen, inner, rparen):
@@ -474,13 +641,19 @@ class ReParser(Parser):
 
     @attach('e : e PLUS e')
     def addition(self, left, plus, right):
-        return RegularExpression('PLUS', left=left, right=right)
+        # Since subtrees are hash-consed, equal subtrees are the same
+        # object, so e + e folds to e with an identity check
+        if left is right:
+            return left
+        return _intern(RegularExpression('PLUS', left=left, right=right))
 
     @attach('e : e STAR')
     def star(self, inner, star):
+        if inner.node_type == 'EPSILON':
+            return inner
         if inner.node_type == 'STAR':
-            return RegularExpression('STAR', inner=inner.inner)
-        return RegularExpression('STAR', inner=inner)
+            return _intern(RegularExpression('STAR', inner=inner.inner))
+        return _intern(RegularExpression('STAR', inner=inner))
 
     # @attach('e : e e')
     # def concat(self, left, right):
@@ -496,16 +669,31 @@ class ReParser(Parser):
             return right
         if right.node_type == 'EPSILON':
             return left
-        return RegularExpression('CONCAT', left=left, right=right)
+        return _intern(RegularExpression('CONCAT', left=left, right=right))
+
 
+_PARSER = ReParser()
+"""Module-level parser instance shared by all calls to
+:meth:`parse_regular_expression`
 
+Constructing a :class:`ReParser` builds the whole LALR automaton of the
+grammar, which dwarfs the cost of parsing any single expression; the parser
+itself holds no state between parses, so one instance serves them all.
+"""
+
+
+@lru_cache(maxsize=1024)
 def parse_regular_expression(string: str) -> RegularExpression:
     """Parses a regular expression, returning a
     :class:`regular_expression.RegularExpression` object
+
+    Results are cached, so that parsing the same string twice only incurs the
+    lexing and parsing cost once. Consequently, the returned
+    :class:`regular_expression.RegularExpression` must not be mutated.
     """
     string = sub(
         r'(?<=[\w\)\*])\s*(?=[\w\(])',
         '-',
         string
     )
-    return ReParser().parse(string)
+    return _PARSER.parse(string)
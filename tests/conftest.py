@@ -0,0 +1,15 @@
+"""Test runner path setup
+
+Ensures the repository root (for ``fapy``) and the tests directory (for the
+shared helpers in :mod:`utils`) are on ``sys.path`` exactly once per process,
+so that imports resolve consistently regardless of the directory the test
+runner is invoked from.
+"""
+
+import pathlib
+import sys
+
+_TESTS = pathlib.Path(__file__).resolve().parent
+for _path in (str(_TESTS.parent), str(_TESTS)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -22,6 +22,9 @@ from fapy.common import (
 from fapy.finite_automaton import (
     FiniteAutomaton
 )
+from utils import (
+    NO_SPACE
+)
 
 
 class BrozozwskiTest(unittest.TestCase):
@@ -52,8 +55,8 @@ class BrozozwskiTest(unittest.TestCase):
             }
         )
         self.assertEqual(
-            repr(brozozwski(aut1)).replace(' ', ''),
-            'a'.replace(' ', '')
+            repr(brozozwski(aut1)).translate(NO_SPACE),
+            'a'
         )
 
         aut2 = FiniteAutomaton(
@@ -67,8 +70,8 @@ class BrozozwskiTest(unittest.TestCase):
             }
         )
         self.assertEqual(
-            repr(brozozwski(aut2)).replace(' ', ''),
-            'CONCAT(a, b)'.replace(' ', '')
+            repr(brozozwski(aut2)).translate(NO_SPACE),
+            'CONCAT(a,b)'
         )
 
         aut2 = FiniteAutomaton(
@@ -4,6 +4,7 @@
 """Unit tests
 """
 
+import functools
 import unittest
 
 from fapy.algorithm_brozozwski_minimize import (
@@ -19,24 +20,33 @@ from fapy.finite_automaton import (
 from fapy.regular_expression import (
     parse_regular_expression
 )
+from utils import (
+    assert_reads,
+    render
+)
+
+_parse = functools.lru_cache(maxsize=None)(parse_regular_expression)
 
 class BrozozwskiMinimizeTest(unittest.TestCase):
 
-    def test_brozozwski_minimize(self):
+    @classmethod
+    def setUpClass(cls):
         alphabet = {'a', 'b', 'c', 'd'}
-        automaton1 = brozozwski_minimize(
-            thompson(parse_regular_expression('abcd'), alphabet)
+        cls.automaton1 = brozozwski_minimize(
+            thompson(_parse('abcd'), alphabet)
         )
-        automaton1.draw(
-            name='BrozozwskiMinimizeTest.test_brozozwski_minimize.automaton1'
-        ).render(directory='out/', format='pdf')
-        self.assertEqual(len(automaton1.states), 5)
-        self.assertTrue(automaton1.read('abcd'))
-        self.assertFalse(automaton1.read('a'))
-        self.assertFalse(automaton1.read('ab'))
-        self.assertFalse(automaton1.read('abc'))
-        self.assertFalse(automaton1.read('bcda'))
-        self.assertFalse(automaton1.read('dcbaa'))
+        render(cls.automaton1, 'BrozozwskiMinimizeTest.automaton1')
+
+    def test_brozozwski_minimize(self):
+        self.assertEqual(len(self.automaton1.states), 5)
+        assert_reads(self, self.automaton1, {
+            'abcd': True,
+            'a': False,
+            'ab': False,
+            'abc': False,
+            'bcda': False,
+            'dcbaa': False,
+        })
 
     def test_transpose(self):
         automaton1 = FiniteAutomaton(
@@ -50,10 +60,12 @@ class BrozozwskiMinimizeTest(unittest.TestCase):
             }
         )
         transposed_automaton1 = transpose(automaton1)
-        self.assertTrue(transposed_automaton1.read('ba'))
-        self.assertFalse(transposed_automaton1.read(''))
-        self.assertFalse(transposed_automaton1.read('a'))
-        self.assertFalse(transposed_automaton1.read('b'))
-        self.assertFalse(transposed_automaton1.read('aa'))
-        self.assertFalse(transposed_automaton1.read('ab'))
-        self.assertFalse(transposed_automaton1.read('bb'))
+        assert_reads(self, transposed_automaton1, {
+            'ba': True,
+            '': False,
+            'a': False,
+            'b': False,
+            'aa': False,
+            'ab': False,
+            'bb': False,
+        })
@@ -4,6 +4,7 @@
 """Unit tests
 """
 
+import functools
 import unittest
 
 # pylint: disable wrong-import-position
@@ -14,65 +15,77 @@ from fapy.algorithm_glushkov import (
 from fapy.regular_expression import (
     parse_regular_expression
 )
+from utils import (
+    assert_reads,
+    NO_SPACE,
+    render
+)
+
+_parse = functools.lru_cache(maxsize=None)(parse_regular_expression)
 
 class GlushkovTest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.aut1 = glushkov(_parse('a b'))
+        cls.aut2 = glushkov(_parse('(a b)* (c + ε) d'))
+        cls.aut3 = glushkov(_parse('(a (ab)*)*'))
+        cls.aut4 = glushkov(_parse('(a (b + bbabb)* c)*'))
+        render(cls.aut1, 'GlushkovTest.aut1')
+        render(cls.aut2, 'GlushkovTest.aut2')
+        render(cls.aut3, 'GlushkovTest.aut3')
+        render(cls.aut4, 'GlushkovTest.aut4')
+
     def test__linearize_regular_expression(self):
-        re1 = parse_regular_expression('a (a + b + ε)* a')
+        re1 = _parse('a (a + b + ε)* a')
         lin1, idx1 = _linearize_regular_expression(re1)
         self.assertEqual(idx1, 4)
         self.assertEqual(len(lin1.alphabet()), 4)
         self.assertEqual(
-            repr(lin1).replace(' ', ''),
-            'CONCAT(CONCAT(a0, STAR(PLUS(PLUS(a1, b2), ε))), a3)'
-            .replace(' ', '')
+            repr(lin1).translate(NO_SPACE),
+            'CONCAT(CONCAT(a0,STAR(PLUS(PLUS(a1,b2),ε))),a3)'
         )
-        re2 = parse_regular_expression('a a a a a a a')
+        re2 = _parse('a a a a a a a')
         lin2, idx2 = _linearize_regular_expression(re2)
         self.assertEqual(idx2, 7)
         self.assertEqual(len(lin2.alphabet()), 7)
 
-    def test_glushkov(self):
-        aut1 = glushkov(parse_regular_expression('a b'))
-        aut1.draw(
-            name='GlushkovTest.test_glushkov.1'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(aut1.read("ab"))
-        self.assertFalse(aut1.read(""))
-        self.assertFalse(aut1.read("a"))
-        self.assertFalse(aut1.read("b"))
-        self.assertFalse(aut1.read("ba"))
-        self.assertFalse(aut1.read("aba"))
+    def test_glushkov_aut1(self):
+        assert_reads(self, self.aut1, {
+            'ab': True,
+            '': False,
+            'a': False,
+            'b': False,
+            'ba': False,
+            'aba': False,
+        })
 
-        aut2 = glushkov(parse_regular_expression('(a b)* (c + ε) d'))
-        aut2.draw(
-            name='GlushkovTest.test_glushkov.2'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(aut2.read("d"))
-        self.assertTrue(aut2.read("abababd"))
-        self.assertTrue(aut2.read("ababcd"))
-        self.assertFalse(aut2.read(""))
-        self.assertFalse(aut2.read("ab"))
-        self.assertFalse(aut2.read("abccd"))
-        self.assertFalse(aut2.read("ccd"))
+    def test_glushkov_aut2(self):
+        assert_reads(self, self.aut2, {
+            'd': True,
+            'abababd': True,
+            'ababcd': True,
+            '': False,
+            'ab': False,
+            'abccd': False,
+            'ccd': False,
+        })
 
-        aut3 = glushkov(parse_regular_expression('(a (ab)*)*'))
-        aut3.draw(
-            name='GlushkovTest.test_glushkov.3'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(aut3.read(""))
-        self.assertTrue(aut3.read("aaaaaa"))
-        self.assertTrue(aut3.read("aababaaaabab"))
-        self.assertFalse(aut3.read("b"))
-        self.assertFalse(aut3.read("bab"))
+    def test_glushkov_aut3(self):
+        assert_reads(self, self.aut3, {
+            '': True,
+            'aaaaaa': True,
+            'aababaaaabab': True,
+            'b': False,
+            'bab': False,
+        })
 
-        aut4 = glushkov(parse_regular_expression('(a (b + bbabb)* c)*'))
-        aut4.draw(
-            name='GlushkovTest.test_glushkov.4'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(aut4.read(""))
-        self.assertTrue(aut4.read("ac"))
-        self.assertTrue(aut4.read("acac"))
-        self.assertTrue(aut4.read("abbcabbabbc"))
-        self.assertFalse(aut4.read("aac"))
-        self.assertFalse(aut4.read("abbabc"))
+    def test_glushkov_aut4(self):
+        assert_reads(self, self.aut4, {
+            '': True,
+            'ac': True,
+            'acac': True,
+            'abbcabbabbc': True,
+            'aac': False,
+            'abbabc': False,
+        })
@@ -13,6 +13,9 @@ from fapy.algorithm_powerset_determinize import (
 from fapy.finite_automaton import (
     FiniteAutomaton
 )
+from utils import (
+    render
+)
 
 
 class PowerSetDeterminizeTest(unittest.TestCase):
@@ -31,9 +34,11 @@ class PowerSetDeterminizeTest(unittest.TestCase):
         )
         det_ndfa = powerset_determinize(ndfa)
         self.assertTrue(det_ndfa.is_deterministic())
-        ndfa.draw(
-            name='PowerSetDeterminizeTest.test_powerset_determinize.ndfa'
-        ).render(directory='out/', format='pdf')
-        det_ndfa.draw(
-            name='PowerSetDeterminizeTest.test_powerset_determinize.det_ndfa'
-        ).render(directory='out/', format='pdf')
+        render(
+            ndfa,
+            'PowerSetDeterminizeTest.test_powerset_determinize.ndfa'
+        )
+        render(
+            det_ndfa,
+            'PowerSetDeterminizeTest.test_powerset_determinize.det_ndfa'
+        )
@@ -4,6 +4,7 @@
 """Unit tests
 """
 
+import functools
 import unittest
 
 # pylint: disable wrong-import-position
@@ -14,198 +15,139 @@ from fapy.algorithm_residual import (
 from fapy.regular_expression import (
     parse_regular_expression
 )
+from utils import (
+    assert_reads,
+    NO_SPACE,
+    render
+)
+
+_parse = functools.lru_cache(maxsize=None)(parse_regular_expression)
+
+RESIDUAL_CASES = [
+    # (regular expression, word, space-stripped residual or None if empty)
+    ('a', 'a', 'ε'),
+    ('a', 'b', None),
+    ('a b', 'a', 'b'),
+    ('a b', 'b', None),
+    ('a + b', 'a', 'ε'),
+    ('a + b', 'b', 'ε'),
+    ('(a + b) c', 'a', 'c'),
+    ('(a + b) c', 'b', 'c'),
+    ('(a + b) c', 'c', None),
+    ('(aa + bb) cc', 'a', 'acc'),
+    ('(aa + bb) cc', 'b', 'bcc'),
+    ('(aa + bb) cc', 'c', None),
+    ('(aa + ab) cc', 'a', '(a+b)cc'),
+    ('(a + b)* a', 'a', '(a+b)*a+ε'),
+    ('(a + b)* a', 'b', '(a+b)*a'),
+    ('(a + b)* a', 'c', None),
+    ('(abc)* a', 'a', 'bc(abc)*a+ε'),
+    ('(abc)* a', 'ab', 'c(abc)*a'),
+    ('(a+ε)(b+ε)(c+ε)(d+ε)', 'a', '(b+ε)(c+ε)(d+ε)'),
+    ('(a+ε)(b+ε)(c+ε)(d+ε)', 'b', '(c+ε)(d+ε)'),
+    ('(a+ε)(b+ε)(c+ε)(d+ε)', 'c', 'd+ε'),
+    ('(a+ε)(b+ε)(c+ε)(d+ε)', 'ab', '(c+ε)(d+ε)'),
+]
+
 
 class ResidualTest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.automaton1 = residual_automaton(_parse('a'))
+        cls.automaton2 = residual_automaton(_parse('ab'))
+        cls.automaton3 = residual_automaton(_parse('a*'))
+        cls.automaton4 = residual_automaton(_parse('a + b'))
+        cls.automaton5 = residual_automaton(_parse('(ab + c)* d'))
+        cls.automaton6 = residual_automaton(_parse('(a b b*)*'))
+        render(cls.automaton1, 'ResidualTest.automaton1')
+        render(cls.automaton2, 'ResidualTest.automaton2')
+        render(cls.automaton3, 'ResidualTest.automaton3')
+        render(cls.automaton4, 'ResidualTest.automaton4')
+        render(cls.automaton5, 'ResidualTest.automaton5')
+        render(cls.automaton6, 'ResidualTest.automaton6')
+
     def test_residual(self):
 
         self.assertIsNone(residual(None, ''))
         self.assertIsNone(residual(None, 'a'))
 
-        self.assertEqual(
-            str(residual(parse_regular_expression('a'), 'a')),
-            'ε'
-        )
-        self.assertIsNone(residual(parse_regular_expression('a'), 'b'))
-
-        self.assertEqual(
-            str(residual(parse_regular_expression('a b'), 'a')),
-            'b'
-        )
-        self.assertIsNone(
-            residual(parse_regular_expression('a b'), 'b')
-        )
-
-        self.assertEqual(
-            str(residual(parse_regular_expression('a + b'), 'a')),
-            'ε'
-        )
-        self.assertEqual(
-            str(residual(parse_regular_expression('a + b'), 'b')),
-            'ε'
-        )
-
-        self.assertEqual(
-            str(residual(parse_regular_expression('(a + b) c'), 'a')),
-            'c'
-        )
-        self.assertEqual(
-            str(residual(parse_regular_expression('(a + b) c'), 'b')),
-            'c'
-        )
-        self.assertIsNone(
-            residual(parse_regular_expression('(a + b) c'), 'c')
-        )
-
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(aa + bb) cc'), 'a')
-            ).replace(' ', ''),
-            'acc'
-        )
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(aa + bb) cc'), 'b')
-            ).replace(' ', ''),
-            'bcc'
-        )
-        self.assertIsNone(
-            residual(parse_regular_expression('(aa + bb) cc'), 'c')
-        )
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(aa + ab) cc'), 'a')
-            ).replace(' ', ''),
-            '(a+b)cc'
-        )
-
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(a + b)* a'), 'a')
-            ).replace(' ', ''),
-            '(a + b)* a + ε'.replace(' ', '')
-        )
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(a + b)* a'), 'b')
-            ).replace(' ', ''),
-            '(a + b)* a'.replace(' ', '')
-        )
-        self.assertIsNone(
-            residual(parse_regular_expression('(a + b)* a'), 'c')
-        )
-
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(abc)* a'), 'a')
-            ).replace(' ', ''),
-            'b c (abc)* a + ε'.replace(' ', '')
-        )
-
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(abc)* a'), 'ab')
-            ).replace(' ', ''),
-            'c (abc)* a'.replace(' ', '')
-        )
-
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(a+ε)(b+ε)(c+ε)(d+ε)'), 'a')
-            ).replace(' ', ''),
-            '(b + ε)(c + ε)(d + ε)'.replace(' ', '')
-        )
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(a+ε)(b+ε)(c+ε)(d+ε)'), 'b')
-            ).replace(' ', ''),
-            '(c + ε)(d + ε)'.replace(' ', '')
-        )
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(a+ε)(b+ε)(c+ε)(d+ε)'), 'c')
-            ).replace(' ', ''),
-            'd + ε'.replace(' ', '')
-        )
-        self.assertEqual(
-            str(
-                residual(parse_regular_expression('(a+ε)(b+ε)(c+ε)(d+ε)'), 'ab')
-            ).replace(' ', ''),
-            '(c + ε) (d + ε)'.replace(' ', '')
-        )
-
-    def test_residual_automaton(self):
-        automaton1 = residual_automaton(parse_regular_expression('a'))
-        automaton1.draw(
-            name='ResidualTest.test_residual_automaton.automaton1'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton1.read('a'))
-        self.assertFalse(automaton1.read(''))
-        self.assertFalse(automaton1.read('aa'))
-        self.assertFalse(automaton1.read('b'))
-        self.assertFalse(automaton1.read('ab'))
-
-        automaton2 = residual_automaton(parse_regular_expression('ab'))
-        automaton2.draw(
-            name='ResidualTest.test_residual_automaton.automaton2'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton2.read('ab'))
-        self.assertFalse(automaton2.read(''))
-        self.assertFalse(automaton2.read('a'))
-        self.assertFalse(automaton2.read('aa'))
-        self.assertFalse(automaton2.read('b'))
-        self.assertFalse(automaton2.read('aba'))
-
-        automaton3 = residual_automaton(parse_regular_expression('a*'))
-        automaton3.draw(
-            name='ResidualTest.test_residual_automaton.automaton3'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton3.read(''))
-        self.assertTrue(automaton3.read('a'))
-        self.assertTrue(automaton3.read('aa'))
-        self.assertTrue(automaton3.read('aaa'))
-        self.assertFalse(automaton3.read('b'))
-        self.assertFalse(automaton3.read('aaaab'))
-
-        automaton4 = residual_automaton(parse_regular_expression('a + b'))
-        automaton4.draw(
-            name='ResidualTest.test_residual_automaton.automaton4'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton4.read('a'))
-        self.assertTrue(automaton4.read('b'))
-        self.assertFalse(automaton4.read(''))
-        self.assertFalse(automaton4.read('ab'))
-        self.assertFalse(automaton4.read('ba'))
-
-        automaton5 = residual_automaton(parse_regular_expression('(ab + c)* d'))
-        automaton5.draw(
-            name='ResidualTest.test_residual_automaton.automaton5'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton5.read('d'))
-        self.assertTrue(automaton5.read('abd'))
-        self.assertTrue(automaton5.read('cd'))
-        self.assertTrue(automaton5.read('abcd'))
-        self.assertTrue(automaton5.read('ababd'))
-        self.assertFalse(automaton5.read(''))
-        self.assertFalse(automaton5.read('ab'))
-        self.assertFalse(automaton5.read('ad'))
-        self.assertFalse(automaton5.read('abad'))
-
-        automaton6 = residual_automaton(parse_regular_expression('(a b b*)*'))
-        automaton6.draw(
-            name='ResidualTest.test_residual_automaton.automaton6'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton6.read(''))
-        self.assertTrue(automaton6.read('ab'))
-        self.assertTrue(automaton6.read('abb'))
-        self.assertTrue(automaton6.read('abab'))
-        self.assertTrue(automaton6.read('abbab'))
-        self.assertFalse(automaton6.read('a'))
-        self.assertFalse(automaton6.read('b'))
-        self.assertFalse(automaton6.read('c'))
-        self.assertFalse(automaton6.read('abababababaabababab'))
-
-        # automaton7 = residual_automaton(parse_regular_expression('(a a* b*)*'))
+        for regex, word, expected in RESIDUAL_CASES:
+            with self.subTest(regex=regex, word=word):
+                result = residual(_parse(regex), word)
+                if expected is None:
+                    self.assertIsNone(result)
+                else:
+                    self.assertEqual(
+                        str(result).translate(NO_SPACE),
+                        expected
+                    )
+
+    def test_residual_automaton_1(self):
+        assert_reads(self, self.automaton1, {
+            'a': True,
+            '': False,
+            'aa': False,
+            'b': False,
+            'ab': False,
+        })
+
+    def test_residual_automaton_2(self):
+        assert_reads(self, self.automaton2, {
+            'ab': True,
+            '': False,
+            'a': False,
+            'aa': False,
+            'b': False,
+            'aba': False,
+        })
+
+    def test_residual_automaton_3(self):
+        assert_reads(self, self.automaton3, {
+            '': True,
+            'a': True,
+            'aa': True,
+            'aaa': True,
+            'b': False,
+            'aaaab': False,
+        })
+
+    def test_residual_automaton_4(self):
+        assert_reads(self, self.automaton4, {
+            'a': True,
+            'b': True,
+            '': False,
+            'ab': False,
+            'ba': False,
+        })
+
+    def test_residual_automaton_5(self):
+        assert_reads(self, self.automaton5, {
+            'd': True,
+            'abd': True,
+            'cd': True,
+            'abcd': True,
+            'ababd': True,
+            '': False,
+            'ab': False,
+            'ad': False,
+            'abad': False,
+        })
+
+    def test_residual_automaton_6(self):
+        assert_reads(self, self.automaton6, {
+            '': True,
+            'ab': True,
+            'abb': True,
+            'abab': True,
+            'abbab': True,
+            'a': False,
+            'b': False,
+            'c': False,
+            'abababababaabababab': False,
+        })
+
+        # automaton7 = residual_automaton(_parse('(a a* b*)*'))
         # automaton7.draw(
         #     name='ResidualTest.test_residual_automaton.automaton7'
         # ).render(directory='out/', format='pdf')
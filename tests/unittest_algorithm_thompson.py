@@ -4,6 +4,7 @@
 """Unit tests
 """
 
+import functools
 import unittest
 
 # pylint: disable wrong-import-position
@@ -13,75 +14,96 @@ from fapy.algorithm_thompson import (
 from fapy.regular_expression import (
     parse_regular_expression
 )
+from utils import (
+    assert_reads,
+    render
+)
+
+_parse = functools.lru_cache(maxsize=None)(parse_regular_expression)
 
 
 class ThompsonTest(unittest.TestCase):
 
     def test_thompson_letter(self):
         alphabet = {'a', 'b'}
-        automaton = thompson(parse_regular_expression('a'), alphabet)
-        automaton.draw(
-            name='ThompsonTest.test_thompson_letter'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton.read('a'))
-        self.assertFalse(automaton.read('b'))
-        self.assertFalse(automaton.read(''))
+        automaton = thompson(_parse('a'), alphabet)
+        render(
+            automaton,
+            'ThompsonTest.test_thompson_letter'
+        )
+        assert_reads(self, automaton, {
+            'a': True,
+            'b': False,
+            '': False,
+        })
 
     def test_thompson_plus(self):
         alphabet = {'a', 'b'}
-        automaton = thompson(parse_regular_expression('a + b'), alphabet)
-        automaton.draw(
-            name='ThompsonTest.test_thompson_plus'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton.read('a'))
-        self.assertTrue(automaton.read('b'))
-        self.assertFalse(automaton.read(''))
-        self.assertFalse(automaton.read('ab'))
+        automaton = thompson(_parse('a + b'), alphabet)
+        render(
+            automaton,
+            'ThompsonTest.test_thompson_plus'
+        )
+        assert_reads(self, automaton, {
+            'a': True,
+            'b': True,
+            '': False,
+            'ab': False,
+        })
 
     def test_thompson_concat(self):
         alphabet = {'a', 'b'}
-        automaton = thompson(parse_regular_expression('a b a'), alphabet)
-        automaton.draw(
-            name='ThompsonTest.test_thompson_concat'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton.read('aba'))
-        self.assertFalse(automaton.read(''))
-        self.assertFalse(automaton.read('a'))
-        self.assertFalse(automaton.read('b'))
-        self.assertFalse(automaton.read('ab'))
-        self.assertFalse(automaton.read('ba'))
-        self.assertFalse(automaton.read('aaaaaba'))
+        automaton = thompson(_parse('a b a'), alphabet)
+        render(
+            automaton,
+            'ThompsonTest.test_thompson_concat'
+        )
+        assert_reads(self, automaton, {
+            'aba': True,
+            '': False,
+            'a': False,
+            'b': False,
+            'ab': False,
+            'ba': False,
+            'aaaaaba': False,
+        })
 
     def test_thompson_star(self):
         alphabet = {'a', 'b'}
         automaton = thompson(
-            parse_regular_expression('((a + b) b)*'),
+            _parse('((a + b) b)*'),
             alphabet)
-        automaton.draw(
-            name='ThompsonTest.test_thompson_star'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton.read(''))
-        self.assertTrue(automaton.read('ab'))
-        self.assertTrue(automaton.read('bb'))
-        self.assertTrue(automaton.read('abbb'))
-        self.assertTrue(automaton.read('abababababababab'))
-        self.assertFalse(automaton.read('a'))
-        self.assertFalse(automaton.read('aa'))
-        self.assertFalse(automaton.read('abbbaa'))
+        render(
+            automaton,
+            'ThompsonTest.test_thompson_star'
+        )
+        assert_reads(self, automaton, {
+            '': True,
+            'ab': True,
+            'bb': True,
+            'abbb': True,
+            'abababababababab': True,
+            'a': False,
+            'aa': False,
+            'abbbaa': False,
+        })
 
     def test_thompson_1(self):
         alphabet = {'a', 'b'}
         automaton = thompson(
-            parse_regular_expression('(a + b)* a (a + b)*'),
+            _parse('(a + b)* a (a + b)*'),
             alphabet
         )
-        automaton.draw(
-            name='ThompsonTest.test_thompson_1'
-        ).render(directory='out/', format='pdf')
-        self.assertTrue(automaton.read('a'))
-        self.assertTrue(automaton.read('aa'))
-        self.assertTrue(automaton.read('aba'))
-        self.assertTrue(automaton.read('bbbbbba'))
-        self.assertTrue(automaton.read('bbbbbbab'))
-        self.assertFalse(automaton.read('bb'))
-        self.assertFalse(automaton.read(''))
+        render(
+            automaton,
+            'ThompsonTest.test_thompson_1'
+        )
+        assert_reads(self, automaton, {
+            'a': True,
+            'aa': True,
+            'aba': True,
+            'bbbbbba': True,
+            'bbbbbbab': True,
+            'bb': False,
+            '': False,
+        })
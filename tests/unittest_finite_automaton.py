@@ -10,9 +10,78 @@ import unittest
 from fapy.finite_automaton import (
     FiniteAutomaton
 )
+from utils import (
+    assert_reads,
+    render
+)
 
 class FiniteAutomatonTest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.dfa = FiniteAutomaton(
+            alphabet={'a', 'b'},
+            states={'q0', 'q1'},
+            initial_states={'q0'},
+            accepting_states={'q1'},
+            transitions={
+                'q0': [('a', 'q1'), ('b', 'q0')],
+                'q1': [('a', 'q1'), ('b', 'q0')]
+            }
+        )
+        cls.ndfa = FiniteAutomaton(
+            alphabet={'a', 'b'},
+            states={'q0', 'q1'},
+            initial_states={'q0'},
+            accepting_states={'q1'},
+            transitions={
+                'q0': [('a', 'q0'), ('b', 'q0'), ('a', 'q1')],
+                'q1': [('a', 'q1'), ('b', 'q1')]
+            }
+        )
+        cls.ndfae = FiniteAutomaton(
+            alphabet={'a', 'b'},
+            states={'q0', 'q1'},
+            initial_states={'q0'},
+            accepting_states={'q1'},
+            transitions={
+                'q0': [('ε', 'q1'), ('b', 'q0')],
+                'q1': [('a', 'q1'), ('b', 'q0')]
+            }
+        )
+        cls.ndfae2 = FiniteAutomaton(
+            alphabet={'a', 'b'},
+            states={'q0', 'q1', 'q2'},
+            initial_states={'q0'},
+            accepting_states={'q2'},
+            transitions={
+                'q0': [('a', 'q0'), ('b', 'q0'), ('a', 'q1')],
+                'q1': [('a', 'q0'), ('b', 'q0'), ('ε', 'q2')]
+            }
+        )
+        cls.ndfae3 = FiniteAutomaton(
+            alphabet={'a', 'b'},
+            states={'q0', 'q1', 'q2'},
+            initial_states={'q0'},
+            accepting_states={'q2'},
+            transitions={
+                'q0': [('ε', 'q1')],
+                'q1': [('ε', 'q2')]
+            }
+        )
+        cls.closure_automaton = FiniteAutomaton(
+            alphabet={'a', 'b'},
+            states={'q0', 'q1', 'q2', 'q3', 'q4', 'q5'},
+            initial_states={'q0'},
+            accepting_states={'q0'},
+            transitions={
+                'q0': [('a', 'q4'), ('ε', 'q1')],
+                'q2': [('ε', 'q3')],
+                'q3': [('ε', 'q4')],
+                'q5': [('ε', 'q4')]
+            }
+        )
+
     def test___init__(self):
         with self.assertRaises(ValueError):
             FiniteAutomaton(
@@ -70,46 +139,17 @@ class FiniteAutomatonTest(unittest.TestCase):
         )
 
     def test_draw(self):
-        dfa = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1'},
-            initial_states={'q0'},
-            accepting_states={'q1'},
-            transitions={
-                'q0': [('a', 'q1'), ('b', 'q0')],
-                'q1': [('a', 'q1'), ('b', 'q0')]
-            }
+        render(
+            self.dfa,
+            'FiniteAutomatonTest.test_draw.dfa'
         )
-        ndfa = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1'},
-            initial_states={'q0'},
-            accepting_states={'q1'},
-            transitions={
-                'q0': [('a', 'q0'), ('b', 'q0'), ('a', 'q1')],
-                'q1': [('a', 'q1'), ('b', 'q1')]
-            }
+        render(
+            self.ndfa,
+            'FiniteAutomatonTest.test_draw.ndfa'
         )
-        dfa.draw(
-            name='FiniteAutomatonTest.test_draw.dfa'
-        ).render(directory='out/', format='pdf')
-        ndfa.draw(
-            name='FiniteAutomatonTest.test_draw.ndfa'
-        ).render(directory='out/', format='pdf')
 
     def test_epsilon_closure(self):
-        automaton = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1', 'q2', 'q3', 'q4', 'q5'},
-            initial_states={'q0'},
-            accepting_states={'q0'},
-            transitions={
-                'q0': [('a', 'q4'), ('ε', 'q1')],
-                'q2': [('ε', 'q3')],
-                'q3': [('ε', 'q4')],
-                'q5': [('ε', 'q4')]
-            }
-        )
+        automaton = self.closure_automaton
         self.assertEqual(automaton.epsilon_closure({'q0'}), {'q0', 'q1'})
         self.assertEqual(automaton.epsilon_closure({'q1'}), {'q1'})
         self.assertEqual(automaton.epsilon_closure({'q2'}), {'q2', 'q3', 'q4'})
@@ -118,86 +158,33 @@ class FiniteAutomatonTest(unittest.TestCase):
         self.assertEqual(automaton.epsilon_closure({'q5'}), {'q4', 'q5'})
 
     def test_is_deterministic(self):
-        dfa = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1'},
-            initial_states={'q0'},
-            accepting_states={'q1'},
-            transitions={
-                'q0': [('a', 'q1'), ('b', 'q0')],
-                'q1': [('a', 'q1'), ('b', 'q0')]
-            }
-        )
-        ndfa = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1'},
-            initial_states={'q0'},
-            accepting_states={'q1'},
-            transitions={
-                'q0': [('a', 'q0'), ('b', 'q0'), ('a', 'q1')],
-                'q1': [('a', 'q1'), ('b', 'q1')]
-            }
-        )
-        ndfae = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1'},
-            initial_states={'q0'},
-            accepting_states={'q1'},
-            transitions={
-                'q0': [('ε', 'q1'), ('b', 'q0')],
-                'q1': [('a', 'q1'), ('b', 'q0')]
-            }
-        )
-        self.assertTrue(dfa.is_deterministic())
-        self.assertFalse(ndfa.is_deterministic())
-        self.assertFalse(ndfae.is_deterministic())
+        self.assertTrue(self.dfa.is_deterministic())
+        self.assertFalse(self.ndfa.is_deterministic())
+        self.assertFalse(self.ndfae.is_deterministic())
 
     def test_read(self):
-        ndfa = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1'},
-            initial_states={'q0'},
-            accepting_states={'q1'},
-            transitions={
-                'q0': [('a', 'q0'), ('b', 'q0'), ('a', 'q1')],
-                'q1': [('a', 'q1'), ('b', 'q1')]
-            }
-        )
-        ndfae = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1', 'q2'},
-            initial_states={'q0'},
-            accepting_states={'q2'},
-            transitions={
-                'q0': [('a', 'q0'), ('b', 'q0'), ('a', 'q1')],
-                'q1': [('a', 'q0'), ('b', 'q0'), ('ε', 'q2')]
-            }
-        )
-        ndfae2 = FiniteAutomaton(
-            alphabet={'a', 'b'},
-            states={'q0', 'q1', 'q2'},
-            initial_states={'q0'},
-            accepting_states={'q2'},
-            transitions={
-                'q0': [('ε', 'q1')],
-                'q1': [('ε', 'q2')]
-            }
-        )
-
-        self.assertTrue(ndfa.read('a'))
-        self.assertTrue(ndfa.read('aa'))
-        self.assertTrue(ndfa.read('aba'))
-        self.assertTrue(ndfa.read('abb'))
-        self.assertFalse(ndfa.read(''))
-        self.assertFalse(ndfa.read('b'))
-        self.assertFalse(ndfa.read('bb'))
-        self.assertFalse(ndfa.read('bbb'))
+        assert_reads(self, self.ndfa, {
+            'a': True,
+            'aa': True,
+            'aba': True,
+            'abb': True,
+            '': False,
+            'b': False,
+            'bb': False,
+            'bbb': False,
+        })
 
-        self.assertTrue(ndfae.read('a'))
-        self.assertTrue(ndfae.read('aa'))
-        self.assertTrue(ndfae.read('aaa'))
-        self.assertTrue(ndfae.read('aba'))
-        self.assertTrue(ndfae.read('bba'))
+        assert_reads(self, self.ndfae2, {
+            'a': True,
+            'aa': True,
+            'aaa': True,
+            'aba': True,
+            'bba': True,
+        })
 
-        self.assertFalse(ndfae.read('b'))
-        self.assertTrue(ndfae2.read(''))
+        assert_reads(self, self.ndfae2, {
+            'b': False,
+        })
+        assert_reads(self, self.ndfae3, {
+            '': True,
+        })
@@ -4,204 +4,226 @@
 """Unit tests
 """
 
+import functools
 import unittest
 
 # pylint: disable wrong-import-position
 from fapy.regular_expression import (
     parse_regular_expression
 )
+from utils import (
+    ast_from_tuple,
+    ast_tuple
+)
+
+_parse = functools.lru_cache(maxsize=None)(parse_regular_expression)
+
+PARSE_CASES = (
+    # (regular expression, tuple-encoded AST, see utils.ast_tuple)
+    ("ε", "ε"),
+    ("a", "a"),
+    ("a b", ('CONCAT', 'a', 'b')),
+    ("ab", ('CONCAT', 'a', 'b')),
+    ("ε b", "b"),
+    ("b ε", "b"),
+    ("ε b ε", "b"),
+    ("ε ε ε", "ε"),
+    ("b ε ε", "b"),
+    ("a*", ('STAR', 'a')),
+    ("a**", ('STAR', 'a')),
+    ("ε*", "ε"),
+    ("a + a", "a"),
+    ("(ab) + (ab)", ('CONCAT', 'a', 'b')),
+    ("a + b", ('PLUS', 'a', 'b')),
+    ("(a + b)", ('PLUS', 'a', 'b')),
+    ("a + ab", ('PLUS', 'a', ('CONCAT', 'a', 'b'))),
+    ("ba + ab", ('PLUS', ('CONCAT', 'b', 'a'), ('CONCAT', 'a', 'b'))),
+    ("a (a + ε) b",
+     ('CONCAT', ('CONCAT', 'a', ('PLUS', 'a', 'ε')), 'b')),
+    ("(a + b)*", ('STAR', ('PLUS', 'a', 'b'))),
+    ("(a + b*)aa b",
+     ('CONCAT',
+      ('CONCAT', ('CONCAT', ('PLUS', 'a', ('STAR', 'b')), 'a'), 'a'),
+      'b')),
+    ("a (a + b*)*", ('CONCAT', 'a', ('STAR', ('PLUS', 'a', ('STAR', 'b'))))),
+    ("((a))", "a"),
+)
+
+ACCEPTING_LETTERS_CASES = (
+    # (regular expression, expected accepting letters)
+    ("ε", frozenset()),
+    ("a", frozenset('a')),
+    ("a b", frozenset('b')),
+    ("a + b", frozenset('ab')),
+    ("a* b", frozenset('b')),
+    ("a b*", frozenset('ab')),
+    ("(a + b)* (c + ε)", frozenset('abc')),
+    ("(c + ε) (a + b)*", frozenset('abc')),
+)
+
+ACCEPTS_EPSILON_CASES = (
+    # (regular expression, whether it accepts the empty word)
+    ('ε', True),
+    ('a*', True),
+    ('a + ε', True),
+    ('(a + b)*', True),
+    ('a', False),
+    ('a* b', False),
+)
+
+ALPHABET_CASES = (
+    # (regular expression, expected alphabet)
+    ('ε', frozenset()),
+    ('a*', frozenset('a')),
+    ('a + ε', frozenset('a')),
+    ('(a + b)*', frozenset('ab')),
+    ('a', frozenset('a')),
+    ('a* b', frozenset('ab')),
+)
+
+INITIAL_LETTERS_CASES = (
+    # (regular expression, expected initial letters)
+    ("ε", frozenset()),
+    ("a", frozenset('a')),
+    ("a b", frozenset('a')),
+    ("a + b", frozenset('ab')),
+    ("a* b", frozenset('ab')),
+    ("a b*", frozenset('a')),
+    ("(a + b)* (c + ε)", frozenset('abc')),
+    ("(c + ε) (a + b)*", frozenset('abc')),
+)
+
+SUCCESSORS_CASES = (
+    # (regular expression, expected successor table)
+    ('a b', {
+        'a': frozenset('b'),
+        'b': frozenset(),
+        'c': frozenset(),
+    }),
+    ('(a + b)*', {
+        'a': frozenset('ab'),
+        'b': frozenset('ab'),
+        'c': frozenset(),
+    }),
+    ('a b a c', {
+        'a': frozenset('bc'),
+        'b': frozenset('a'),
+        'c': frozenset(),
+    }),
+    ('(a b)* (c + ε) d', {
+        'a': frozenset('b'),
+        'b': frozenset('acd'),
+        'c': frozenset('d'),
+        'd': frozenset(),
+    }),
+    ('(a+ε)(b+ε)(c+ε)(d+ε)', {
+        'a': frozenset('bcd'),
+        'b': frozenset('cd'),
+        'c': frozenset('d'),
+        'd': frozenset(),
+    }),
+    ('(a (bc)*)*', {
+        'a': frozenset('ab'),
+        'b': frozenset('c'),
+        'c': frozenset('ab'),
+    }),
+)
 
 
 class RegularExpressionTest(unittest.TestCase):
 
     def test___eq__(self):
         self.assertEqual(
-            parse_regular_expression('a'),
-            parse_regular_expression('a')
+            _parse('a'),
+            _parse('a')
         )
         self.assertNotEqual(
-            parse_regular_expression('a'),
-            parse_regular_expression('b')
+            _parse('a'),
+            _parse('b')
         )
         self.assertEqual(
-            parse_regular_expression('ε'),
-            parse_regular_expression('ε')
+            _parse('ε'),
+            _parse('ε')
         )
         self.assertNotEqual(
-            parse_regular_expression('ε'),
-            parse_regular_expression('b')
+            _parse('ε'),
+            _parse('b')
         )
         self.assertEqual(
-            parse_regular_expression('a + b'),
-            parse_regular_expression('a + b')
+            _parse('a + b'),
+            _parse('a + b')
         )
         self.assertNotEqual(
-            parse_regular_expression('a'),
-            parse_regular_expression('a + b')
+            _parse('a'),
+            _parse('a + b')
         )
         self.assertNotEqual(
-            parse_regular_expression('b + a'),
-            parse_regular_expression('a + b')
+            _parse('b + a'),
+            _parse('a + b')
         )
         self.assertEqual(
-            parse_regular_expression('(a + b)* c'),
-            parse_regular_expression('(a + b)* c')
+            _parse('(a + b)* c'),
+            _parse('(a + b)* c')
         )
         self.assertNotEqual(
-            parse_regular_expression('(a + b)* c'),
-            parse_regular_expression('a* c')
+            _parse('(a + b)* c'),
+            _parse('a* c')
         )
         self.assertNotEqual(
-            parse_regular_expression('(a + b)* c'),
-            parse_regular_expression('(a + b) c')
+            _parse('(a + b)* c'),
+            _parse('(a + b) c')
         )
+        # Every expression of the parser test corpus compares and hashes
+        # equal to an independently built structural copy of itself
+        for regex, _ in PARSE_CASES:
+            with self.subTest(regex=regex):
+                parsed = _parse(regex)
+                copy = ast_from_tuple(ast_tuple(parsed))
+                self.assertIsNot(parsed, copy)
+                self.assertEqual(parsed, copy)
+                self.assertEqual(hash(parsed), hash(copy))
 
 
 
     def test_accepting_letters(self):
-        self.assertEqual(
-            parse_regular_expression("ε").accepting_letters(),
-            set()
-        )
-        self.assertEqual(
-            parse_regular_expression("a").accepting_letters(),
-            {'a'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a b").accepting_letters(),
-            {'b'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a + b").accepting_letters(),
-            {'a', 'b'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a* b").accepting_letters(),
-            {'b'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a b*").accepting_letters(),
-            {'a', 'b'}
-        )
-        self.assertEqual(
-            parse_regular_expression("(a + b)* (c + ε)").accepting_letters(),
-            {'a', 'b', 'c'}
-        )
-        self.assertEqual(
-            parse_regular_expression("(c + ε) (a + b)*").accepting_letters(),
-            {'a', 'b', 'c'}
-        )
+        for regex, expected in ACCEPTING_LETTERS_CASES:
+            with self.subTest(regex=regex):
+                self.assertEqual(_parse(regex).accepting_letters(), expected)
 
     def test_accepts_epsilon(self):
-        self.assertTrue(parse_regular_expression('ε').accepts_epsilon())
-        self.assertTrue(parse_regular_expression('a*').accepts_epsilon())
-        self.assertTrue(parse_regular_expression('a + ε').accepts_epsilon())
-        self.assertTrue(parse_regular_expression('(a + b)*').accepts_epsilon())
-        self.assertFalse(parse_regular_expression('a').accepts_epsilon())
-        self.assertFalse(parse_regular_expression('a* b').accepts_epsilon())
+        for regex, expected in ACCEPTS_EPSILON_CASES:
+            with self.subTest(regex=regex):
+                self.assertEqual(_parse(regex).accepts_epsilon(), expected)
 
     def test_alphabet(self):
-        self.assertEqual(parse_regular_expression('ε').alphabet(), set())
-        self.assertEqual(parse_regular_expression('a*').alphabet(), {'a'})
-        self.assertEqual(parse_regular_expression('a + ε').alphabet(), {'a'})
-        self.assertEqual(parse_regular_expression('(a + b)*').alphabet(),
-                         {'a', 'b'})
-        self.assertEqual(parse_regular_expression('a').alphabet(), {'a'})
-        self.assertEqual(parse_regular_expression('a* b').alphabet(), {'a', 'b'})
+        for regex, expected in ALPHABET_CASES:
+            with self.subTest(regex=regex):
+                self.assertEqual(_parse(regex).alphabet(), expected)
 
     def test_initial_letters(self):
-        self.assertEqual(
-            parse_regular_expression("ε").initial_letters(),
-            set()
-        )
-        self.assertEqual(
-            parse_regular_expression("a").initial_letters(),
-            {'a'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a b").initial_letters(),
-            {'a'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a + b").initial_letters(),
-            {'a', 'b'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a* b").initial_letters(),
-            {'a', 'b'}
-        )
-        self.assertEqual(
-            parse_regular_expression("a b*").initial_letters(),
-            {'a'}
-        )
-        self.assertEqual(
-            parse_regular_expression("(a + b)* (c + ε)").initial_letters(),
-            {'a', 'b', 'c'}
-        )
-        self.assertEqual(
-            parse_regular_expression("(c + ε) (a + b)*").initial_letters(),
-            {'a', 'b', 'c'}
-        )
+        for regex, expected in INITIAL_LETTERS_CASES:
+            with self.subTest(regex=regex):
+                self.assertEqual(_parse(regex).initial_letters(), expected)
 
     def test_successors(self):
-        re1 = parse_regular_expression('a b')
-        self.assertEqual(re1.successors('a'), {'b'})
-        self.assertEqual(re1.successors('b'), set())
-        self.assertEqual(re1.successors('c'), set())
-        re2 = parse_regular_expression('(a + b)*')
-        self.assertEqual(re2.successors('a'), {'a', 'b'})
-        self.assertEqual(re2.successors('b'), {'a', 'b'})
-        self.assertEqual(re2.successors('c'), set())
-        re3 = parse_regular_expression('a b a c')
-        self.assertEqual(re3.successors('a'), {'b', 'c'})
-        self.assertEqual(re3.successors('b'), {'a'})
-        self.assertEqual(re3.successors('c'), set())
-        re4 = parse_regular_expression('(a b)* (c + ε) d')
-        self.assertEqual(re4.successors('a'), {'b'})
-        self.assertEqual(re4.successors('b'), {'a', 'c', 'd'})
-        self.assertEqual(re4.successors('c'), {'d'})
-        self.assertEqual(re4.successors('d'), set())
-        re5 = parse_regular_expression('(a+ε)(b+ε)(c+ε)(d+ε)')
-        self.assertEqual(re5.successors('a'), {'b', 'c', 'd'})
-        self.assertEqual(re5.successors('b'), {'c', 'd'})
-        self.assertEqual(re5.successors('c'), {'d'})
-        self.assertEqual(re5.successors('d'), set())
-        re6 = parse_regular_expression('(a (bc)*)*')
-        self.assertEqual(re6.successors('a'), {'a', 'b'})
-        self.assertEqual(re6.successors('b'), {'c'})
-        self.assertEqual(re6.successors('c'), {'a', 'b'})
+        for regex, expected in SUCCESSORS_CASES:
+            with self.subTest(regex=regex):
+                successors_all = _parse(regex).successors_all()
+                for letter, successors in expected.items():
+                    self.assertEqual(
+                        successors_all.get(letter, frozenset()),
+                        successors
+                    )
 
 
 
 class ReParserTest(unittest.TestCase):
 
     def test_parse(self):
-        problems = [
-            ("ε", "ε"),
-            ("a", "a"),
-            ("a b", "CONCAT(a, b)"),
-            ("ab", "CONCAT(a, b)"),
-            ("ε b", "b"),
-            ("b ε", "b"),
-            ("ε b ε", "b"),
-            ("ε ε ε", "ε"),
-            ("b ε ε", "b"),
-            ("a*", "STAR(a)"),
-            ("a**", "STAR(a)"),
-            ("a + b", "PLUS(a, b)"),
-            ("(a + b)", "PLUS(a, b)"),
-            ("a + ab", "PLUS(a, CONCAT(a, b))"),
-            ("ba + ab", "PLUS(CONCAT(b, a), CONCAT(a, b))"),
-            ("a (a + ε) b", "CONCAT(CONCAT(a, PLUS(a, ε)), b)"),
-            ("(a + b)*", "STAR(PLUS(a, b))"),
-            ("(a + b*)aa b",
-             "CONCAT(CONCAT(CONCAT(PLUS(a, STAR(b)), a), a), b)"),
-            ("a (a + b*)*", "CONCAT(a, STAR(PLUS(a, STAR(b))))"),
-            ("((a))", "a")
-        ]
-        for problem, solution in problems:
-            self.assertEqual(
-                repr(parse_regular_expression(problem)).replace(" ", ""),
-                solution.replace(" ", ""),
-                f'Failed regular expression: {problem}'
-            )
+        for problem, solution in PARSE_CASES:
+            with self.subTest(problem=problem):
+                self.assertEqual(
+                    ast_tuple(_parse(problem)),
+                    solution,
+                    f'Failed regular expression: {problem}'
+                )
@@ -0,0 +1,112 @@
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+"""Shared helpers for unit tests
+"""
+
+import os
+import unittest
+
+from typing import (
+    Dict,
+    Tuple,
+    Union
+)
+
+from fapy.finite_automaton import (
+    FiniteAutomaton
+)
+from fapy.regular_expression import (
+    RegularExpression
+)
+
+NO_SPACE = str.maketrans('', '', ' ')
+"""Translation table removing spaces, for whitespace-insensitive string
+comparisons: ``'a + b'.translate(NO_SPACE) == 'a+b'``. :meth:`str.translate`
+is single-pass and avoids the intermediate allocations of chained
+:meth:`str.replace` calls."""
+
+
+def ast_tuple(
+        regular_expression: RegularExpression) -> Union[str, Tuple]:
+    """Encodes the AST of a regular expression as nested tuples
+
+    ``EPSILON`` and ``LETTER`` nodes become plain strings, binary nodes
+    become ``(node_type, left, right)`` and stars become
+    ``('STAR', inner)``, so that ``a + b*`` encodes to
+    ``('PLUS', 'a', ('STAR', 'b'))``. Comparing these tuples checks the
+    parse structure directly, without the string round-trip (and whitespace
+    normalization) of comparing ``repr`` outputs.
+    """
+    node_type = regular_expression.node_type
+    if node_type in ('CONCAT', 'PLUS'):
+        return (
+            node_type,
+            ast_tuple(regular_expression.left),
+            ast_tuple(regular_expression.right)
+        )
+    if node_type == 'EPSILON':
+        return 'ε'
+    if node_type == 'LETTER':
+        return regular_expression.letter
+    return ('STAR', ast_tuple(regular_expression.inner))
+
+
+def ast_from_tuple(encoded: Union[str, Tuple]) -> RegularExpression:
+    """Builds a regular expression from its :meth:`ast_tuple` encoding
+
+    The nodes are constructed directly, bypassing the parser and its
+    interning, so the result is an independent structural copy: comparing
+    it against a parsed expression actually exercises the structural
+    ``__eq__`` and ``__hash__`` instead of trivially comparing an object
+    with itself.
+    """
+    if isinstance(encoded, str):
+        if encoded == 'ε':
+            return RegularExpression('EPSILON')
+        return RegularExpression('LETTER', letter=encoded)
+    if encoded[0] == 'STAR':
+        return RegularExpression('STAR', inner=ast_from_tuple(encoded[1]))
+    return RegularExpression(
+        encoded[0],
+        left=ast_from_tuple(encoded[1]),
+        right=ast_from_tuple(encoded[2])
+    )
+
+
+def assert_reads(
+        test: unittest.TestCase,
+        automaton: FiniteAutomaton,
+        expected: Dict[str, bool]) -> None:
+    """Asserts the acceptance of a batch of words by an automaton
+
+    ``expected`` maps words to whether the automaton should accept them. All
+    words go through a single
+    :meth:`finite_automaton.FiniteAutomaton.read_batch` call, and the
+    :meth:`unittest.TestCase` machinery (``subTest`` context, assertion
+    message formatting) is only engaged on a mismatch, which keeps the
+    common all-passing case cheap.
+    """
+    words = list(expected)
+    results = automaton.read_batch(words)
+    for word, accepted in zip(words, results):
+        if accepted != expected[word]:
+            with test.subTest(word=word):
+                test.assertEqual(
+                    accepted,
+                    expected[word],
+                    f'Failed word: "{word}"'
+                )
+
+
+def render(automaton: FiniteAutomaton, name: str) -> None:
+    """Renders an automaton to ``out/<name>.pdf`` using graphviz
+
+    Rendering shells out to the ``dot`` binary and dominates the run time of
+    the test suite while being irrelevant to correctness, so both the
+    :meth:`finite_automaton.FiniteAutomaton.draw` call and the rendering are
+    skipped unless the ``FAPY_RENDER`` environment variable is set.
+    """
+    if not os.environ.get('FAPY_RENDER'):
+        return
+    automaton.draw(name=name).render(directory='out/', format='pdf')